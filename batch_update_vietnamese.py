@@ -6,42 +6,53 @@ from pathlib import Path
 
 # Add project root to path
 
+from concurrent.futures import ThreadPoolExecutor
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from core.processing.processor import JobDescriptionProcessor
 from core.storage import JobStorage
 import time
 
-def batch_update_vietnamese():
-    print("=== Batch Update Vietnamese Keywords ===")
+# Number of job updates sent to MongoDB per bulk_write
+WRITE_BATCH_SIZE = 500
 
-    processor = JobDescriptionProcessor()
-    storage = JobStorage()
+# Number of descriptions sent through the NLP pipeline together
+NLP_BATCH_SIZE = 64
 
-    # Get all LinkedIn jobs that haven't been processed for Vietnamese yet
-    all_jobs = list(storage.db.jobs.find({
-        'source': 'linkedin',
-        'vietnamese_keywords': {'$exists': False}
-    }))
 
-    print(f"Found {len(all_jobs)} LinkedIn jobs to process")
+def flush_updates(collection, pending):
+    """Send buffered updates in one bulk_write and return how many jobs matched.
 
-    if not all_jobs:
-        print("All jobs already processed!")
-        return
+    Unordered writes still apply the rest of the batch when some updates fail; other
+    MongoDB errors are raised.
+    """
+    if not pending:
+        return 0
 
-    success_count = 0
+    try:
+        result = collection.bulk_write(pending, ordered=False)
+        return result.matched_count
+    except BulkWriteError as e:
+        write_errors = e.details.get('writeErrors', [])
+        print(f"  ✗ Bulk write failed for {len(write_errors)}/{len(pending)} jobs")
+        for error in write_errors:
+            print(f"    - #{error.get('index')}: {error.get('errmsg')}")
+        return e.details.get('nMatched', 0)
+    finally:
+        pending.clear()
 
-    for i, job in enumerate(all_jobs, 1):
-        print(f"\nProcessing {i}/{len(all_jobs)}: {job['title'][:50]}...")
 
-        try:
-            description = job.get('description', '')
-            if len(description.strip()) < 20:
-                print("  Skipping - description too short")
-                continue
+def process_job_batch(processor, batch, pending, total_jobs):
+    """Run NLP over a batch of (index, job) pairs and queue their updates.
 
-            # Process with NLP
-            result = processor.process(description)
+    Reposted descriptions are answered from the processor's result cache.
+    """
+    processed = processor.process_batch([job['description'] for _, job in batch], batch_size=NLP_BATCH_SIZE)
 
+    for (i, job), result in zip(batch, processed):
+        print(f"\nProcessing {i}/{total_jobs}: {job['title'][:50]}...")
+
+        try:
             # Update job
             update_data = {
                 'vietnamese_keywords': result.vietnamese_keywords,
@@ -53,12 +64,7 @@ def batch_update_vietnamese():
                 'vietnamese_analysis_timestamp': result.timestamp
             }
 
-            storage.db.jobs.update_one(
-                {'_id': job['_id']},
-                {'$set': update_data}
-            )
-
-            success_count += 1
+            pending.append(UpdateOne({'_id': job['_id']}, {'$set': update_data}))
 
             # Show summary
             vn_count = len(result.vietnamese_keywords)
@@ -73,10 +79,61 @@ def batch_update_vietnamese():
 
         except Exception as e:
             print(f"  ✗ Error: {e}")
-            continue
+
+
+def batch_update_vietnamese():
+    print("=== Batch Update Vietnamese Keywords ===")
+
+    processor = JobDescriptionProcessor()
+    storage = JobStorage()
+
+    # Get all LinkedIn jobs that haven't been processed for Vietnamese yet
+    query = {
+        'source': 'linkedin',
+        'vietnamese_keywords': {'$exists': False}
+    }
+    total_jobs = storage.db.jobs.count_documents(query)
+
+    print(f"Found {total_jobs} LinkedIn jobs to process")
+
+    if not total_jobs:
+        print("All jobs already processed!")
+        return
+
+    # Stream only the fields needed for processing
+    cursor = storage.db.jobs.find(query, {'_id': 1, 'title': 1, 'description': 1}).batch_size(200)
+
+    pending = []
+    batch = []
+
+    # Bulk writes run on a background thread so NLP on the next batch overlaps Mongo I/O
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        write_futures = []
+
+        for i, job in enumerate(cursor, 1):
+            description = job.get('description') or ''
+            if len(description.strip()) < 20:
+                print(f"\nProcessing {i}/{total_jobs}: {job['title'][:50]}...")
+                print("  Skipping - description too short")
+                continue
+
+            batch.append((i, job))
+            if len(batch) >= NLP_BATCH_SIZE:
+                process_job_batch(processor, batch, pending, total_jobs)
+                batch = []
+
+            if len(pending) >= WRITE_BATCH_SIZE:
+                write_futures.append(writer.submit(flush_updates, storage.db.jobs, pending))
+                pending = []
+
+        if batch:
+            process_job_batch(processor, batch, pending, total_jobs)
+
+        write_futures.append(writer.submit(flush_updates, storage.db.jobs, pending))
+        success_count = sum(future.result() for future in write_futures)
 
     print(f"\n=== Batch Update Complete ===")
-    print(f"Successfully updated: {success_count}/{len(all_jobs)} jobs")
+    print(f"Successfully updated: {success_count}/{total_jobs} jobs")
 
 def show_final_statistics():
     print(f"\n=== Final Vietnamese Keywords Statistics ===")
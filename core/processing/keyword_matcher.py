@@ -9,42 +9,102 @@ Matches tokens against predefined dictionaries of:
 """
 
 import json
+import hashlib
 import logging
-from typing import Dict, List, Any, Set, Optional
+import os
+import pickle
+from typing import Dict, List, Any, Set, Optional, Tuple, NamedTuple
 from pathlib import Path
+from functools import cached_property
 import re
+import unicodedata
+from bisect import bisect_left
+from heapq import nlargest
 
 # Try to import optional dependencies
 try:
-    from fuzzywuzzy import fuzz, process
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
     FUZZY_AVAILABLE = True
 except ImportError:
     FUZZY_AVAILABLE = False
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Separators treated as word breaks during normalization
+_SEP_TRANS = str.maketrans({'/': ' ', '-': ' ', '_': ' ', '.': ' '})
+_WS_RE = re.compile(r'\s+')
+
+
+def _is_word_char(ch: str) -> bool:
+    """Whether ch continues a word; combining marks (decomposed Vietnamese tones) count."""
+    return ch.isalnum() or unicodedata.category(ch)[0] == 'M'
+
+
+# Smaller fuzzy score matrices are cheaper to compute on the calling thread
+PARALLEL_CDIST_MIN_CELLS = 20000
+
+# Bump when the layout of the compiled matcher state changes
+COMPILED_CACHE_VERSION = 4
+
+
+class KeywordHit(NamedTuple):
+    """Internal match record; converted to a result dict only when returned."""
+    entry_id: int
+    score: float
+    match_type: str
+    matched_text: Optional[str]
+
 
 class KeywordMatcher:
     """Match keywords against predefined dictionaries with fuzzy matching support."""
 
+    # Compiled state shared by all instances in the process, keyed by _compiled_cache_key()
+    _compiled_states: Dict[str, Dict[str, Any]] = {}
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.fuzzy_matching = self.config.get('fuzzy_matching', True) and FUZZY_AVAILABLE
         self.similarity_threshold = self.config.get('similarity_threshold', 0.8)
+        self.fuzzy_workers = self.config.get('fuzzy_workers', -1)
 
-        # Load dictionaries
-        self.skills_dict = self._load_dictionary('skills')
-        self.tech_dict = self._load_dictionary('technologies')
-        self.soft_skills_dict = self._load_dictionary('soft_skills')
-        self.industry_terms_dict = self._load_dictionary('industry_terms')
-        self.vietnamese_dict = self._load_dictionary('vietnamese')
-        self.extended_tech_dict = self._load_dictionary('extended_tech')
-
-        # Compile patterns for better performance
-        self._compile_patterns()
+        # Dictionaries are loaded and matchers compiled on first use
+        self._compiled = False
 
         if not FUZZY_AVAILABLE and self.config.get('fuzzy_matching', False):
-            logger.warning("fuzzywuzzy not available. Install with: pip install fuzzywuzzy python-levenshtein")
+            logger.warning("rapidfuzz not available. Install with: pip install rapidfuzz")
+
+        if not AHOCORASICK_AVAILABLE:
+            logger.warning("pyahocorasick not available, using regex keyword search. Install with: pip install pyahocorasick")
+
+    @cached_property
+    def skills_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('skills')
+
+    @cached_property
+    def tech_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('technologies')
+
+    @cached_property
+    def soft_skills_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('soft_skills')
+
+    @cached_property
+    def industry_terms_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('industry_terms')
+
+    @cached_property
+    def vietnamese_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('vietnamese')
+
+    @cached_property
+    def extended_tech_dict(self) -> Dict[str, Any]:
+        return self._load_dictionary('extended_tech')
 
     def _load_dictionary(self, dict_type: str) -> Dict[str, Any]:
         """Load dictionary from config or use defaults."""
@@ -192,29 +252,222 @@ class KeywordMatcher:
         return {}
 
     def _compile_patterns(self):
-        """Compile regex patterns for better matching performance."""
-        # Create a combined pattern for all keywords
-        all_keywords = set()
-
-        # Include all dictionaries
-        for dict_data in [self.skills_dict, self.tech_dict, self.soft_skills_dict,
-                         self.industry_terms_dict, self.vietnamese_dict, self.extended_tech_dict]:
-            for category_data in dict_data.values():
-                if isinstance(category_data, dict):
-                    all_keywords.update(category_data.keys())
-                    # Add aliases
-                    for item_data in category_data.values():
-                        if isinstance(item_data, dict) and 'aliases' in item_data:
-                            all_keywords.update(item_data['aliases'])
-
-        # Sort by length (longest first) for better matching
-        self.all_keywords = sorted(all_keywords, key=len, reverse=True)
-
-        # Create pattern for word boundaries
-        self.word_boundary_pattern = re.compile(r'\b[\w\s\-\+\.]+\b', re.IGNORECASE)
+        """Compile keyword matchers for better matching performance."""
+        # Reuse compiled matchers from this process, or from disk when a cache path is configured;
+        # relative paths resolve under the project root rather than the working directory
+        cache_path = self.config.get('compiled_cache_path')
+        if cache_path:
+            cache_path = Path(__file__).parent.parent.parent / cache_path
+        cache_key = self._compiled_cache_key()
+        state = KeywordMatcher._compiled_states.get(cache_key)
+        if state is None and cache_path:
+            state = self._load_compiled_state(cache_path, cache_key)
+        if state is None:
+            state = self._build_compiled_state()
+            if cache_path:
+                self._save_compiled_state(cache_path, cache_key, state)
+        KeywordMatcher._compiled_states[cache_key] = state
+
+        self.kw_names = state['kw_names']
+        self.kw_categories = state['kw_categories']
+        self.kw_subcategories = state['kw_subcategories']
+        self.kw_weights = state['kw_weights']
+        self.kw_key_ids = state['kw_key_ids']
+        self.kw_dict_types = state['kw_dict_types']
+        self.num_keywords = state['num_keywords']
+        self.automaton = state['automaton']
+        self.term_lengths = state['term_lengths']
+        self.term_lookup = state['term_lookup']
+        self.fuzzy_buckets = state['fuzzy_buckets']
+        self._compiled = True
+
+    def _build_compiled_state(self) -> Dict[str, Any]:
+        """Build the keyword table, exact/alias matchers and fuzzy buckets for all dictionaries."""
+        table = self._build_keyword_table()
+
+        # Build one Aho-Corasick automaton over the terms of all dictionaries; entries know
+        # their owning dictionary. Without pyahocorasick, keep the term lookup and its
+        # distinct term lengths to probe every candidate from each word start instead
+        all_entry_ids = [entry_id for entry_ids in table['dict_entries'].values() for entry_id in entry_ids]
+        terms = self._collect_terms(all_entry_ids, table['kw_names'], table['kw_aliases'])
+        automaton = None
+        term_lookup = {}
+        term_lengths = ()
+        if AHOCORASICK_AVAILABLE:
+            if terms:
+                automaton = self._build_automaton(terms)
+        else:
+            term_lookup = terms
+            term_lengths = tuple(sorted({len(term_key) for term_key in terms}))
+
+        # Bucket fuzzy candidates by word count, then by preprocessed length
+        fuzzy_buckets = {}
+        if self.fuzzy_matching:
+            for dict_type, entry_ids in table['dict_entries'].items():
+                fuzzy_buckets[dict_type] = self._build_fuzzy_buckets(entry_ids, table['kw_names'])
+
+        return {
+            'kw_names': table['kw_names'],
+            'kw_categories': table['kw_categories'],
+            'kw_subcategories': table['kw_subcategories'],
+            'kw_weights': table['kw_weights'],
+            'kw_key_ids': table['kw_key_ids'],
+            'kw_dict_types': table['kw_dict_types'],
+            'num_keywords': table['num_keywords'],
+            'automaton': automaton,
+            'term_lengths': term_lengths,
+            'term_lookup': term_lookup,
+            'fuzzy_buckets': fuzzy_buckets
+        }
+
+    def _build_keyword_table(self) -> Dict[str, Any]:
+        """Flatten all dictionaries into parallel per-entry lists indexed by an integer id.
+
+        Every (dictionary, category, keyword) entry gets its own id. ``kw_key_ids`` maps
+        entries sharing a keyword within one dictionary to the same key, which is what
+        matches are de-duplicated on.
+        """
+        kw_names = []
+        kw_categories = []
+        kw_subcategories = []
+        kw_weights = []
+        kw_aliases = []
+        kw_key_ids = []
+        kw_dict_types = []
+        dict_entries = {}
+        key_index = {}
+
+        for dict_type, dict_data in self._get_dictionaries().items():
+            entry_ids = []
+            for category_name, category_data in dict_data.items():
+                if not isinstance(category_data, dict):
+                    continue
+
+                for keyword, keyword_data in category_data.items():
+                    is_dict = isinstance(keyword_data, dict)
+                    entry_ids.append(len(kw_names))
+                    kw_names.append(keyword)
+                    kw_categories.append(category_name)
+                    kw_subcategories.append(keyword_data.get('category', '') if is_dict else '')
+                    kw_weights.append(keyword_data.get('weight', 1.0) if is_dict else 1.0)
+                    kw_aliases.append(keyword_data['aliases'] if is_dict and 'aliases' in keyword_data else [])
+                    kw_key_ids.append(key_index.setdefault((dict_type, keyword), len(key_index)))
+                    kw_dict_types.append(dict_type)
+            dict_entries[dict_type] = entry_ids
+
+        return {
+            'kw_names': kw_names,
+            'kw_categories': kw_categories,
+            'kw_subcategories': kw_subcategories,
+            'kw_weights': kw_weights,
+            'kw_aliases': kw_aliases,
+            'kw_key_ids': kw_key_ids,
+            'kw_dict_types': kw_dict_types,
+            'num_keywords': len(key_index),
+            'dict_entries': dict_entries
+        }
+
+    def _compiled_cache_key(self) -> str:
+        """Hash the dictionaries and build options that determine the compiled state."""
+        payload = json.dumps({
+            'version': COMPILED_CACHE_VERSION,
+            'dictionaries': self._get_dictionaries(),
+            'fuzzy_matching': self.fuzzy_matching,
+            'ahocorasick': AHOCORASICK_AVAILABLE
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+    def _load_compiled_state(self, cache_path: Path, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load compiled state from disk if it was built from the same dictionaries."""
+        path = Path(cache_path)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == cache_key:
+                return cached['state']
+        except Exception as e:
+            logger.warning(f"Could not load compiled keyword cache from {cache_path}: {e}")
+
+        return None
+
+    def _save_compiled_state(self, cache_path: Path, cache_key: str, state: Dict[str, Any]):
+        """Write compiled state to disk atomically."""
+        path = Path(cache_path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'key': cache_key, 'state': state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not save compiled keyword cache to {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _get_dictionaries(self) -> Dict[str, Dict[str, Any]]:
+        """Map result keys to their loaded dictionaries."""
+        return {
+            'skills': self.skills_dict,
+            'technologies': self.tech_dict,
+            'soft_skills': self.soft_skills_dict,
+            'industry_terms': self.industry_terms_dict,
+            'vietnamese_keywords': self.vietnamese_dict,
+            'extended_technologies': self.extended_tech_dict
+        }
+
+    def _collect_terms(self, entry_ids: List[int], kw_names: List[str],
+                       kw_aliases: List[List[str]]) -> Dict[str, Tuple[Tuple[int, Optional[str]], ...]]:
+        """Flatten keywords and aliases of a dictionary into a term lookup.
+
+        Terms are normalized the same way as the input text and map to a tuple of
+        ``(entry_id, alias_or_None)`` pairs.
+        """
+        terms = {}
+
+        for entry_id in entry_ids:
+            candidates = [(kw_names[entry_id], None)]
+            candidates.extend((alias, alias) for alias in kw_aliases[entry_id])
+
+            for term, alias in candidates:
+                term_key = self._normalize_text(term)
+                if term_key:
+                    terms.setdefault(term_key, []).append((entry_id, alias))
+
+        return {term_key: tuple(entries) for term_key, entries in terms.items()}
+
+    def _build_fuzzy_buckets(self, entry_ids: List[int],
+                             kw_names: List[str]) -> Dict[int, Dict[int, Tuple[List[int], List[str]]]]:
+        """Group keywords as ``{word_count: {query_length: (entry_ids, queries)}}``."""
+        buckets = {}
+
+        for entry_id in entry_ids:
+            keyword = kw_names[entry_id]
+            query = fuzz_utils.default_process(keyword)
+            if query:
+                ids, queries = buckets.setdefault(len(keyword.split()), {}).setdefault(len(query), ([], []))
+                ids.append(entry_id)
+                queries.append(query)
+
+        return buckets
+
+    def _build_automaton(self, terms: Dict[str, Tuple[Tuple[int, Optional[str]], ...]]):
+        """Build an Aho-Corasick automaton whose values are ``(term_length, entries)``."""
+        automaton = ahocorasick.Automaton()
+        for term_key, entries in terms.items():
+            automaton.add_word(term_key, (len(term_key), entries))
+        automaton.make_automaton()
+        return automaton
 
     def match(self, text: str) -> Dict[str, Any]:
         """Match keywords in text against all dictionaries."""
+        if not self._compiled:
+            self._compile_patterns()
+
         # Clean and normalize text
         normalized_text = self._normalize_text(text)
 
@@ -231,144 +484,230 @@ class KeywordMatcher:
         }
 
         # Match against each dictionary
-        skills_matches = self._match_against_dictionary(normalized_text, self.skills_dict, 'skills')
-        tech_matches = self._match_against_dictionary(normalized_text, self.tech_dict, 'technologies')
-        soft_skills_matches = self._match_against_dictionary(normalized_text, self.soft_skills_dict, 'soft_skills')
-        industry_matches = self._match_against_dictionary(normalized_text, self.industry_terms_dict, 'industry_terms')
-        vietnamese_matches = self._match_against_dictionary(normalized_text, self.vietnamese_dict, 'vietnamese_keywords')
-        extended_tech_matches = self._match_against_dictionary(normalized_text, self.extended_tech_dict, 'extended_technologies')
-
-        results['skills'] = skills_matches
-        results['technologies'] = tech_matches
-        results['soft_skills'] = soft_skills_matches
-        results['industry_terms'] = industry_matches
-        results['vietnamese_keywords'] = vietnamese_matches
-        results['extended_technologies'] = extended_tech_matches
+        # Tokenize once; fuzzy word windows are built lazily and shared by all dictionaries
+        words = normalized_text.split()
+        phrase_cache = {}
+
+        # One exact/alias scan for all dictionaries, partitioned by owning dictionary
+        exact_hits = self._find_exact_matches(normalized_text)
+        hits = {dict_type: self._find_hits(normalized_text, dict_type, words, phrase_cache,
+                                           exact_hits.get(dict_type, {}))
+                for dict_type in self._get_dictionaries()}
+
+        # Confidence is computed on the compact hits before building result dicts
+        results['total_matches'] = sum(len(dict_hits) for dict_hits in hits.values())
+        results['confidence'] = self._calculate_confidence(hits, results['total_matches'])
+
+        for dict_type, dict_hits in hits.items():
+            results[dict_type] = [self._create_match_from_hit(hit) for hit in dict_hits]
 
         # Extract seniority levels from Vietnamese dictionary
+        vietnamese_matches = results['vietnamese_keywords']
         if vietnamese_matches:
             seniority_matches = [match for match in vietnamese_matches
                                if any(keyword in match.get('category', '') for keyword in ['level', 'seniority'])]
             results['seniority_levels'] = seniority_matches
 
-        # Calculate statistics
-        all_matches = [skills_matches, tech_matches, soft_skills_matches,
-                      industry_matches, vietnamese_matches, extended_tech_matches]
-        total_matches = sum(len(matches) for matches in all_matches)
-        results['total_matches'] = total_matches
-        results['confidence'] = self._calculate_confidence(results)
-
         return results
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for better matching."""
-        # Convert to lowercase
-        text = text.lower()
-
-        # Replace common separators with spaces
-        text = re.sub(r'[/\-_\.]', ' ', text)
-
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
-
-    def _match_against_dictionary(self, text: str, dictionary: Dict[str, Any], dict_type: str) -> List[Dict[str, Any]]:
-        """Match text against a specific dictionary."""
-        matches = []
-
-        for category_name, category_data in dictionary.items():
-            if not isinstance(category_data, dict):
+        # Lowercase, replace common separators with spaces and collapse whitespace
+        return _WS_RE.sub(' ', text.lower().translate(_SEP_TRANS)).strip()
+
+    def _find_hits(self, text: str, dict_type: str, words: Optional[List[str]] = None,
+                   phrase_cache: Optional[Dict[int, Tuple[List[str], List[int]]]] = None,
+                   exact_hits: Optional[Dict[int, KeywordHit]] = None) -> List[KeywordHit]:
+        """Find exact, alias and fuzzy hits of one dictionary, best score first.
+
+        ``words``, ``phrase_cache`` and ``exact_hits`` let ``match()`` share tokenization
+        and the exact/alias scan across dictionaries.
+        """
+        if words is None:
+            words = text.split()
+        if phrase_cache is None:
+            phrase_cache = {}
+
+        # Hits are keyed by keyword id
+        if exact_hits is None:
+            exact_hits = self._find_exact_matches(text).get(dict_type, {})
+        hits = exact_hits
+
+        # Fuzzy matching if enabled (skipped for keywords already matched exactly or by alias)
+        if self.fuzzy_matching:
+            kw_key_ids = self.kw_key_ids
+            for entry_id, fuzzy_score in self._fuzzy_match(dict_type, hits, words, phrase_cache):
+                hits[kw_key_ids[entry_id]] = KeywordHit(entry_id, fuzzy_score, 'fuzzy', None)
+
+        return sorted(hits.values(), key=lambda hit: hit.score, reverse=True)
+
+    def _find_exact_matches(self, text: str) -> Dict[str, Dict[int, KeywordHit]]:
+        """Find exact keyword and alias hits, grouped by dictionary and keyed by keyword id."""
+        hits_by_dict = {}
+        kw_key_ids = self.kw_key_ids
+        kw_dict_types = self.kw_dict_types
+
+        for entries in self._iter_term_hits(text):
+            for entry_id, alias in entries:
+                hits = hits_by_dict.get(kw_dict_types[entry_id])
+                if hits is None:
+                    hits = hits_by_dict[kw_dict_types[entry_id]] = {}
+                key_id = kw_key_ids[entry_id]
+                existing = hits.get(key_id)
+                if alias is None:
+                    if existing is None or existing.match_type != 'exact':
+                        hits[key_id] = KeywordHit(entry_id, 1.0, 'exact', None)
+                elif existing is None:
+                    hits[key_id] = KeywordHit(entry_id, 0.9, 'alias', alias)
+
+        return hits_by_dict
+
+    def _iter_term_hits(self, text: str):
+        """Yield the entry tuple of every dictionary term found in text on word boundaries.
+
+        Both backends report every term ending at each position, longest first, so
+        overlapping keywords and aliases are all found whichever is installed.
+        """
+        text_len = len(text)
+        if self.automaton is not None:
+            # Single linear pass over the text for the keywords and aliases of all dictionaries
+            for end, (term_len, entries) in self.automaton.iter(text):
+                start = end - term_len + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < text_len and _is_word_char(text[end + 1]):
+                    continue
+                yield entries
+            return
+
+        # Probe each term length from every position not preceded by a word character,
+        # keeping only candidates that also end on a word boundary
+        lookup = self.term_lookup
+        term_lengths = self.term_lengths
+        word_chars = [_is_word_char(ch) for ch in text]
+        found = []
+        for start in range(text_len):
+            if start > 0 and word_chars[start - 1]:
                 continue
-
-            for keyword, keyword_data in category_data.items():
-                # Direct match
-                if self._is_keyword_in_text(keyword, text):
-                    match = self._create_match_result(keyword, keyword_data, 1.0, 'exact', category_name)
-                    matches.append(match)
+            for term_len in term_lengths:
+                end = start + term_len
+                if end > text_len:
+                    break
+                if end < text_len and word_chars[end]:
                     continue
+                entries = lookup.get(text[start:end])
+                if entries is not None:
+                    found.append((end, -term_len, entries))
+
+        found.sort(key=lambda hit: hit[:2])
+        for _, _, entries in found:
+            yield entries
+
+    def _fuzzy_match(self, dict_type: str, skip: Dict[int, Any], words: List[str],
+                     phrase_cache: Dict[int, Tuple[List[str], List[int]]]) -> List[Tuple[int, float]]:
+        """Fuzzy match a dictionary's keywords against same-length word windows of the text.
+
+        Each word-count bucket is scored against all text phrases of that length in one
+        batched ``process.cdist`` call. Keyword ids in ``skip`` are ignored. Returns
+        ``(entry_id, score)`` for scores reaching the threshold.
+        """
+        buckets = self.fuzzy_buckets.get(dict_type)
+        if not FUZZY_AVAILABLE or not buckets:
+            return []
+
+        score_cutoff = self.similarity_threshold * 100
+        kw_key_ids = self.kw_key_ids
+
+        results = []
+        for word_count, length_buckets in buckets.items():
+            if word_count == 0:
+                continue
 
-                # Check aliases
-                if isinstance(keyword_data, dict) and 'aliases' in keyword_data:
-                    for alias in keyword_data['aliases']:
-                        if self._is_keyword_in_text(alias, text):
-                            match = self._create_match_result(keyword, keyword_data, 0.9, 'alias', category_name, alias)
-                            matches.append(match)
-                            break
-
-                # Fuzzy matching if enabled
-                if self.fuzzy_matching:
-                    fuzzy_score = self._fuzzy_match(keyword, text)
-                    if fuzzy_score >= self.similarity_threshold:
-                        match = self._create_match_result(keyword, keyword_data, fuzzy_score, 'fuzzy', category_name)
-                        matches.append(match)
-
-        # Remove duplicates and sort by score
-        unique_matches = {match['keyword']: match for match in matches}
-        return sorted(unique_matches.values(), key=lambda x: x['score'], reverse=True)
-
-    def _is_keyword_in_text(self, keyword: str, text: str) -> bool:
-        """Check if keyword exists in text with word boundaries."""
-        # Escape special regex characters in keyword
-        escaped_keyword = re.escape(keyword)
-        pattern = rf'\\b{escaped_keyword}\\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
-
-    def _fuzzy_match(self, keyword: str, text: str) -> float:
-        """Perform fuzzy matching between keyword and text."""
-        if not FUZZY_AVAILABLE:
-            return 0.0
-
-        # Extract potential matches from text
-        words = text.split()
-
-        # Single word keyword
-        if ' ' not in keyword:
-            best_match = process.extractOne(keyword, words, scorer=fuzz.ratio)
-            return (best_match[1] / 100.0) if best_match and best_match[1] >= (self.similarity_threshold * 100) else 0.0
+            phrases, phrase_lengths = self._get_phrases(words, word_count, phrase_cache)
+            if not phrases:
+                continue
 
-        # Multi-word keyword - check against phrases
-        phrases = []
-        keyword_len = len(keyword.split())
-        for i in range(len(words) - keyword_len + 1):
-            phrase = ' '.join(words[i:i + keyword_len])
-            phrases.append(phrase)
+            entry_ids = []
+            queries = []
+            for query_len, (ids, bucket_queries) in length_buckets.items():
+                if not self._length_can_match(query_len, phrase_lengths):
+                    continue
+                for entry_id, query in zip(ids, bucket_queries):
+                    if kw_key_ids[entry_id] not in skip:
+                        entry_ids.append(entry_id)
+                        queries.append(query)
+            if not entry_ids:
+                continue
 
-        if phrases:
-            best_match = process.extractOne(keyword, phrases, scorer=fuzz.ratio)
-            return (best_match[1] / 100.0) if best_match and best_match[1] >= (self.similarity_threshold * 100) else 0.0
+            # Spread large score matrices across cores; thread start-up dominates small ones
+            workers = self.fuzzy_workers if len(queries) * len(phrases) >= PARALLEL_CDIST_MIN_CELLS else 1
+            scores = process.cdist(queries, phrases, scorer=fuzz.ratio,
+                                   score_cutoff=score_cutoff, workers=workers)
+            for entry_id, best in zip(entry_ids, scores.max(axis=1)):
+                if best >= score_cutoff:
+                    results.append((entry_id, float(best) / 100.0))
 
-        return 0.0
+        return results
 
-    def _create_match_result(self, keyword: str, keyword_data: Dict[str, Any], score: float,
-                           match_type: str, category: str, matched_text: str = None) -> Dict[str, Any]:
-        """Create a standardized match result."""
+    def _length_can_match(self, query_len: int, phrase_lengths: List[int]) -> bool:
+        """Check whether a query of this length can reach the threshold against any phrase length.
+
+        fuzz.ratio is 2 * LCS / (len_a + len_b), so a query of length n can only reach
+        threshold t against phrases of length n * t / (2 - t) .. n * (2 - t) / t.
+        """
+        threshold = self.similarity_threshold
+        if threshold <= 0:
+            return True
+
+        min_len = query_len * threshold / (2 - threshold) - 1e-9
+        max_len = query_len * (2 - threshold) / threshold + 1e-9
+        idx = bisect_left(phrase_lengths, min_len)
+        return idx < len(phrase_lengths) and phrase_lengths[idx] <= max_len
+
+    def _get_phrases(self, words: List[str], keyword_len: int,
+                     phrase_cache: Dict[int, Tuple[List[str], List[int]]]) -> Tuple[List[str], List[int]]:
+        """Return preprocessed word windows of ``keyword_len`` words and their sorted distinct lengths."""
+        cached = phrase_cache.get(keyword_len)
+        if cached is None:
+            # Sliding windows of keyword_len words, built by zipping shifted word lists
+            phrases = [fuzz_utils.default_process(' '.join(window))
+                       for window in zip(*(words[i:] for i in range(keyword_len)))]
+            cached = (phrases, sorted({len(phrase) for phrase in phrases}))
+            phrase_cache[keyword_len] = cached
+        return cached
+
+    def _create_match_from_hit(self, hit: KeywordHit) -> Dict[str, Any]:
+        """Create a standardized match result for a hit."""
+        entry_id = hit.entry_id
+        keyword = self.kw_names[entry_id]
         return {
             'keyword': keyword,
-            'matched_text': matched_text or keyword,
-            'score': score,
-            'match_type': match_type,
-            'category': category,
-            'weight': keyword_data.get('weight', 1.0) if isinstance(keyword_data, dict) else 1.0,
-            'subcategory': keyword_data.get('category', '') if isinstance(keyword_data, dict) else ''
+            'matched_text': hit.matched_text or keyword,
+            'score': hit.score,
+            'match_type': hit.match_type,
+            'category': self.kw_categories[entry_id],
+            'weight': self.kw_weights[entry_id],
+            'subcategory': self.kw_subcategories[entry_id]
         }
 
-    def _calculate_confidence(self, results: Dict[str, Any]) -> float:
+    def _calculate_confidence(self, hits: Dict[str, List[KeywordHit]], total_matches: int) -> float:
         """Calculate overall confidence score for keyword matching."""
-        total_matches = results['total_matches']
-
         if total_matches == 0:
             return 0.0
 
-        # Weight different types of matches
+        # Weight different types of matches and collect categories in one pass
         weighted_score = 0.0
         total_weight = 0.0
+        match_categories = set()
+        kw_weights = self.kw_weights
+        kw_categories = self.kw_categories
 
-        for match_list in [results['skills'], results['technologies'], results['soft_skills'], results['industry_terms']]:
-            for match in match_list:
-                score = match['score'] * match['weight']
-                weighted_score += score
-                total_weight += match['weight']
+        for dict_type in ('skills', 'technologies', 'soft_skills', 'industry_terms'):
+            for hit in hits.get(dict_type, ()):
+                weight = kw_weights[hit.entry_id]
+                weighted_score += hit.score * weight
+                total_weight += weight
+                match_categories.add(kw_categories[hit.entry_id])
 
         if total_weight == 0:
             return 0.0
@@ -377,11 +716,6 @@ class KeywordMatcher:
         confidence = weighted_score / total_weight
 
         # Apply bonus for diversity of matches
-        match_categories = set()
-        for match_list in [results['skills'], results['technologies'], results['soft_skills'], results['industry_terms']]:
-            for match in match_list:
-                match_categories.add(match['category'])
-
         diversity_bonus = min(len(match_categories) / 10.0, 0.2)  # Max 0.2 bonus
 
         return min(confidence + diversity_bonus, 1.0)
@@ -396,4 +730,4 @@ class KeywordMatcher:
                 all_matches.append(match)
 
         # Sort by score and return top matches
-        return sorted(all_matches, key=lambda x: x['score'], reverse=True)[:limit]
+        return nlargest(limit, all_matches, key=lambda x: x['score'])
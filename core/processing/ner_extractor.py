@@ -9,7 +9,12 @@ Uses SpaCy for:
 """
 
 import logging
-from typing import Dict, List, Any, Set, Tuple
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, product
+from typing import Dict, List, Any, Set, Tuple, Iterable, Iterator, Optional
 import re
 
 # Try to import spaCy, fallback gracefully if not available
@@ -17,54 +22,225 @@ try:
     import spacy
     from spacy.matcher import Matcher, PhraseMatcher
     from spacy.tokens import Doc, Span
+    from spacy.symbols import NOUN, PROPN
     SPACY_AVAILABLE = True
 except ImportError:
     SPACY_AVAILABLE = False
     spacy = None
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
 class NERExtractor:
     """Extract entities and phrases using SpaCy NLP."""
 
+    # Result list fed by each pattern label
+    LABEL_TARGETS = {
+        'PROGRAMMING_SKILL': 'skills',
+        'SOFT_SKILL': 'skills',
+        'JOB_ROLE': 'roles',
+        'TECHNOLOGY': 'technologies',
+        'RESPONSIBILITY': 'responsibilities',
+        'QUALIFICATION': 'qualifications'
+    }
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.model_name = self.config.get('model_name', 'en_core_web_sm')
         self.custom_entities = self.config.get('custom_entities', True)
         self.confidence_threshold = self.config.get('confidence_threshold', 0.7)
-
-        self.nlp = None
+        self.batch_size = self.config.get('batch_size', 64)
+        self.n_process = self.config.get('n_process', 1)
+        self.extract_entities = self.config.get('extract_entities', True)
+        self.contextual_extraction = self.config.get('contextual_extraction', True)
+        self.contextual_technologies = self.config.get('contextual_technologies', True)
+        self.use_gpu = self.config.get('use_gpu', False)
+        self.gpu_model_name = self.config.get('gpu_model_name', 'en_core_web_trf')
+        self.background_load = self.config.get('background_load', True)
+        self.sentence_cache_size = self.config.get('sentence_cache_size', 0)
+        self.length_sort_window = self.config.get('length_sort_window', 1024)
+
+        # Per-sentence extraction parts keyed by sentence text, so boilerplate isn't parsed again
+        self._sentence_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._sentence_cache_lock = threading.Lock()
+
+        self._nlp = None
+        self._nlp_future = None
+        self._nlp_lock = threading.Lock()
         self.matcher = None
         self.phrase_matcher = None
 
+        # Compile regex patterns for efficiency
+        self._compile_patterns()
+
         if SPACY_AVAILABLE:
-            self._load_model()
-            self._setup_matchers()
+            if self.use_gpu:
+                self._enable_gpu()
+            # The GPU allocator is bound to the thread that required it, so load there
+            if self.background_load and not self.use_gpu:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spacy-load')
+                self._nlp_future = executor.submit(self._load_model)
+                executor.shutdown(wait=False)
+            else:
+                self._nlp = self._load_model()
+                self._setup_matchers()
         else:
             logger.warning("SpaCy not available. NER extraction will use fallback methods.")
 
-    def _load_model(self):
-        """Load SpaCy model."""
+    def _compile_patterns(self):
+        """Compile regex patterns used by the contextual extractors."""
+        # Contexts that introduce a list of skills, e.g. "experience with python, sql"
+        self.skill_contexts = ["experience with", "knowledge of", "proficient in", "skilled in", "expert in"]
+
+        # Lookahead so every context occurrence is reported, even inside another context's skill list
+        alternation = '|'.join(re.escape(context) for context in self.skill_contexts)
+        self.skill_context_pattern = re.compile(rf'(?=({alternation})\s+([^.]+))')
+        self.skill_split_pattern = re.compile(r'[,;]|\band\b')
+
+        # Sentence boundaries for the sentence cache: whitespace after end punctuation, or a line break
+        self.sentence_boundary_pattern = re.compile(r'(?<=[.!?])\s+|\n\s*')
+
+        # Common technology keywords whose syntactic head names a technology, and heads to ignore
+        self.tech_context_keywords = [
+            'framework', 'library', 'database', 'platform', 'tool', 'technology',
+            'stack', 'environment', 'system', 'software'
+        ]
+        self.tech_context_stopwords = ['team', 'work', 'job', 'role', 'data', 'big', 'new', 'good', 'best']
+
+        # Keywords for fallback extraction, scanned in one Aho-Corasick pass when available
+        self.fallback_keywords = {
+            'skills': [
+                'python', 'java', 'javascript', 'react', 'angular', 'vue',
+                'machine learning', 'data science', 'sql', 'git', 'docker',
+                'aws', 'azure', 'kubernetes', 'teamwork', 'leadership',
+                'communication', 'problem solving'
+            ],
+            'technologies': [
+                'react', 'angular', 'vue', 'django', 'flask', 'spring',
+                'mysql', 'postgresql', 'mongodb', 'redis', 'docker',
+                'kubernetes', 'aws', 'azure', 'git', 'jenkins'
+            ],
+            'roles': [
+                'developer', 'engineer', 'analyst', 'scientist', 'manager',
+                'architect', 'lead', 'senior', 'junior', 'intern'
+            ]
+        }
+        self.fallback_automaton = self._build_fallback_automaton() if AHOCORASICK_AVAILABLE else None
+
+    def _build_fallback_automaton(self):
+        """Build an automaton whose values are the ``(category, keyword)`` pairs of each keyword."""
+        entries = {}
+        for category, keywords in self.fallback_keywords.items():
+            for keyword in keywords:
+                entries.setdefault(keyword, []).append((category, keyword))
+
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_entries in entries.items():
+            automaton.add_word(keyword, tuple(keyword_entries))
+        automaton.make_automaton()
+        return automaton
+
+    def _enable_gpu(self):
+        """Run spaCy on the GPU; must happen before the model is loaded."""
         try:
-            self.nlp = spacy.load(self.model_name)
-            logger.info(f"Loaded SpaCy model: {self.model_name}")
-        except OSError:
-            logger.warning(f"Could not load {self.model_name}. Trying en_core_web_sm...")
+            spacy.require_gpu()
+            logger.info("SpaCy running on GPU")
+        except Exception as e:
+            logger.warning(f"Could not enable GPU for SpaCy, using CPU: {e}")
+            self.use_gpu = False
+            return
+
+        # Worker processes can't share the GPU
+        if self.n_process != 1:
+            logger.warning("n_process is ignored when use_gpu is enabled; using a single process")
+            self.n_process = 1
+
+    @property
+    def nlp(self):
+        """SpaCy pipeline, waiting for a background load to finish on first access."""
+        if self._nlp_future is not None:
+            # Threads processing jobs concurrently must not see the pipeline before its matchers
+            with self._nlp_lock:
+                if self._nlp_future is not None:
+                    self._nlp = self._nlp_future.result()
+                    self._setup_matchers()
+                    self._nlp_future = None
+        return self._nlp
+
+    def wait_until_loaded(self):
+        """Block until a background model load has finished and the matchers are set up.
+
+        The extraction pool calls this before starting so its start-up doesn't compete with the load.
+        """
+        self.nlp
+
+    def _load_model(self):
+        """Load SpaCy model without the pipeline components extraction doesn't use.
+
+        On the GPU the transformer model (``gpu_model_name``) is tried first; then
+        ``model_name`` and finally en_core_web_sm.
+        """
+        exclude = self._unused_components()
+        candidates = [self.model_name, "en_core_web_sm"]
+        if self.use_gpu and self.gpu_model_name:
+            candidates.insert(0, self.gpu_model_name)
+
+        for name in dict.fromkeys(candidates):
             try:
-                self.nlp = spacy.load("en_core_web_sm")
-                logger.info("Loaded fallback model: en_core_web_sm")
-            except OSError:
-                logger.error("No SpaCy model available. Install with: python -m spacy download en_core_web_sm")
-                self.nlp = None
+                nlp = spacy.load(name, exclude=exclude)
+            except (OSError, ValueError) as e:
+                # ValueError: the package is installed but a factory (e.g. spacy-transformers) is missing
+                logger.warning(f"Could not load {name}: {e}")
+                continue
+            logger.info(f"Loaded SpaCy model: {name}")
+            return self._ensure_sentence_boundaries(nlp)
+
+        logger.error("No SpaCy model available. Install with: python -m spacy download en_core_web_sm")
+        return None
+
+    def _unused_components(self) -> List[str]:
+        """Pipeline components whose output no enabled extraction step reads."""
+        # Lemmas are never used; ents come from ner; sentences, heads and POS tags
+        # for the contextual extractors come from parser, tagger and attribute_ruler
+        unused = ['lemmatizer']
+        if not self.extract_entities:
+            unused.append('ner')
+        if not self.contextual_extraction:
+            unused.extend(['tagger', 'attribute_ruler', 'parser', 'tok2vec'])
+        elif not self.contextual_technologies:
+            # Skill contexts only need sentence boundaries, which senter gives without parsing
+            unused.extend(['tagger', 'attribute_ruler', 'parser'])
+        return unused
+
+    def _ensure_sentence_boundaries(self, nlp):
+        """Enable the senter (or a rule-based sentencizer) when the parser isn't loaded."""
+        if not self.contextual_extraction or nlp.has_pipe('parser'):
+            return nlp
+        if 'senter' in nlp.disabled:
+            nlp.enable_pipe('senter')
+        elif not nlp.has_pipe('senter') and not nlp.has_pipe('sentencizer'):
+            nlp.add_pipe('sentencizer', first=True)
+        return nlp
 
     def _setup_matchers(self):
         """Setup pattern matchers for job-specific entities."""
-        if not self.nlp:
+        if not self._nlp:
             return
 
-        self.matcher = Matcher(self.nlp.vocab)
-        self.phrase_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        self.matcher = Matcher(self._nlp.vocab)
+        self.phrase_matcher = PhraseMatcher(self._nlp.vocab, attr="LOWER")
+        self._label_order = {}
+        self._label_targets = {}
+
+        # Lexeme hashes for the contextual technology extraction
+        self.tech_keyword_hashes = {self._nlp.vocab.strings.add(word) for word in self.tech_context_keywords}
+        self.tech_stopword_hashes = {self._nlp.vocab.strings.add(word) for word in self.tech_context_stopwords}
 
         # Define patterns for different entity types
         self._setup_skill_patterns()
@@ -101,8 +277,8 @@ class NERExtractor:
         ]
 
         # Add patterns to matcher
-        self.matcher.add("PROGRAMMING_SKILL", programming_patterns)
-        self.matcher.add("SOFT_SKILL", soft_skill_patterns)
+        self._add_patterns("PROGRAMMING_SKILL", programming_patterns)
+        self._add_patterns("SOFT_SKILL", soft_skill_patterns)
 
     def _setup_role_patterns(self):
         """Setup patterns for role/position detection."""
@@ -121,7 +297,7 @@ class NERExtractor:
             [{"LOWER": "team"}, {"LOWER": "lead"}]
         ]
 
-        self.matcher.add("JOB_ROLE", role_patterns)
+        self._add_patterns("JOB_ROLE", role_patterns)
 
     def _setup_tech_patterns(self):
         """Setup patterns for technology detection."""
@@ -145,7 +321,7 @@ class NERExtractor:
             [{"LOWER": {"IN": ["git", "jenkins", "jira", "confluence", "slack", "tableau", "powerbi"]}}],
         ]
 
-        self.matcher.add("TECHNOLOGY", tech_patterns)
+        self._add_patterns("TECHNOLOGY", tech_patterns)
 
     def _setup_responsibility_patterns(self):
         """Setup patterns for responsibility detection."""
@@ -162,7 +338,7 @@ class NERExtractor:
             [{"LOWER": "participate"}, {"LOWER": "in"}]
         ]
 
-        self.matcher.add("RESPONSIBILITY", responsibility_patterns)
+        self._add_patterns("RESPONSIBILITY", responsibility_patterns)
 
     def _setup_qualification_patterns(self):
         """Setup patterns for qualification detection."""
@@ -178,56 +354,234 @@ class NERExtractor:
             [{"LOWER": "expert"}, {"LOWER": "in"}],
         ]
 
-        self.matcher.add("QUALIFICATION", qualification_patterns)
+        self._add_patterns("QUALIFICATION", qualification_patterns)
+
+    def _add_patterns(self, label: str, patterns: List[List[Dict[str, Any]]]):
+        """Register token patterns, routing literal ones to the PhraseMatcher.
+
+        Patterns made only of ``LOWER`` literals or ``LOWER`` ``IN`` sets are expanded into
+        phrase docs; anything using other attributes or operators stays on the Matcher.
+        """
+        match_id = self._nlp.vocab.strings.add(label)
+        self._label_order.setdefault(match_id, len(self._label_order))
+        self._label_targets[match_id] = self.LABEL_TARGETS.get(label)
+
+        phrases = []
+        token_patterns = []
+        for pattern in patterns:
+            alternatives = self._literal_alternatives(pattern)
+            if alternatives is None:
+                token_patterns.append(pattern)
+            else:
+                phrases.extend(product(*alternatives))
+
+        if phrases:
+            self.phrase_matcher.add(label, [Doc(self._nlp.vocab, words=list(words)) for words in phrases])
+        if token_patterns:
+            self.matcher.add(label, token_patterns)
+
+    def _literal_alternatives(self, pattern: List[Dict[str, Any]]) -> Optional[List[List[str]]]:
+        """Return the allowed lowercase words per token, or None if the pattern isn't literal."""
+        alternatives = []
+        for token in pattern:
+            if set(token) != {"LOWER"}:
+                return None
+            value = token["LOWER"]
+            if isinstance(value, str):
+                alternatives.append([value])
+            elif isinstance(value, dict) and set(value) == {"IN"}:
+                alternatives.append(list(value["IN"]))
+            else:
+                return None
+        return alternatives
+
+    def _find_pattern_matches(self, doc) -> List[Tuple[int, int, int]]:
+        """Run both matchers, ordered like a single Matcher: by end, start, then label."""
+        matches = self.phrase_matcher(doc)
+        if len(self.matcher):
+            matches += self.matcher(doc)
+        label_order = self._label_order
+        matches.sort(key=lambda match: (match[2], match[1], label_order.get(match[0], 0)))
+        return matches
 
     def extract(self, text: str) -> Dict[str, Any]:
         """Extract entities from text using SpaCy."""
         if not SPACY_AVAILABLE or not self.nlp:
             return self._fallback_extraction(text)
 
-        doc = self.nlp(text)
+        if self.sentence_cache_size > 0:
+            return next(self._extract_with_sentence_cache([text]))
 
-        results = {
-            'skills': [],
-            'roles': [],
-            'technologies': [],
-            'responsibilities': [],
-            'qualifications': [],
-            'benefits': [],
-            'entities': [],
-            'confidence': 0.0
-        }
+        return self._extract_from_doc(self.nlp(text))
 
-        # Extract named entities
-        entities = self._extract_named_entities(doc)
-        results['entities'] = entities
+    def extract_batch(self, texts: Iterable[str], batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Extract entities from many texts, streaming them through ``nlp.pipe``.
+
+        ``batch_size`` and ``n_process`` default to the ``ner`` config; ``n_process=-1``
+        parses with one worker process per CPU (not with ``use_gpu``). Yields one result dict
+        per text, in input order.
+        """
+        if not SPACY_AVAILABLE or not self.nlp:
+            for text in texts:
+                yield self._fallback_extraction(text)
+            return
+
+        if self.use_gpu:
+            n_process = 1
+
+        if self.sentence_cache_size > 0:
+            yield from self._extract_with_sentence_cache(texts, batch_size, n_process)
+            return
+
+        batch_size = batch_size or self.batch_size
+        n_process = n_process or self.n_process
+        if self.length_sort_window > batch_size:
+            yield from self._extract_sorted_by_length(texts, batch_size, n_process)
+            return
 
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._extract_from_doc(doc)
+
+    def _extract_sorted_by_length(self, texts: Iterable[str], batch_size: int,
+                                  n_process: int) -> Iterator[Dict[str, Any]]:
+        """Parse windows of ``length_sort_window`` texts shortest first, yielding in input order.
+
+        Each ``nlp.pipe`` batch then holds texts of similar length, so models that pad a batch
+        to its longest text (transformers) waste less work. Documents are parsed independently,
+        so results are unchanged.
+        """
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, self.length_sort_window))
+            if not chunk:
+                return
+
+            order = sorted(range(len(chunk)), key=lambda i: len(chunk[i]))
+            results = [None] * len(chunk)
+            docs = self.nlp.pipe((chunk[i] for i in order), batch_size=batch_size, n_process=n_process)
+            for i, doc in zip(order, docs):
+                results[i] = self._extract_from_doc(doc)
+            yield from results
+
+    def _extract_from_doc(self, doc) -> Dict[str, Any]:
+        """Run all extraction steps on an already parsed document."""
         # Extract using pattern matching
-        matches = self.matcher(doc)
-        pattern_results = self._process_pattern_matches(doc, matches)
-
-        # Merge results
-        for key in ['skills', 'roles', 'technologies', 'responsibilities', 'qualifications']:
-            if key in pattern_results:
-                results[key].extend(pattern_results[key])
-
-        # Extract skills using multiple methods
-        results['skills'].extend(self._extract_skills_contextual(doc))
-        results['technologies'].extend(self._extract_technologies_contextual(doc))
-
-        # Remove duplicates - only process lists that should contain strings
-        string_lists = ['skills', 'roles', 'technologies', 'responsibilities', 'qualifications', 'benefits']
-        for key in string_lists:
-            if key in results and isinstance(results[key], list) and results[key]:
-                # Only process if all items are strings
-                if all(isinstance(item, str) for item in results[key]):
-                    results[key] = list(dict.fromkeys(results[key]))
+        matches = self._find_pattern_matches(doc)
+        found = self._process_pattern_matches(doc, matches)
+
+        # Extract skills using multiple methods; dict updates keep first-seen order and drop duplicates
+        if self.contextual_extraction:
+            found['skills'].update(dict.fromkeys(self._extract_skills_contextual(doc)))
+            if self.contextual_technologies:
+                found['technologies'].update(dict.fromkeys(self._extract_technologies_contextual(doc)))
+
+        # Build the result once, converting each de-duplicated dict straight to its list
+        results = {key: list(items) for key, items in found.items()}
+        results['benefits'] = []
+
+        # Extract named entities
+        results['entities'] = self._extract_named_entities(doc) if self.extract_entities else []
 
         # Calculate confidence score
         results['confidence'] = self._calculate_confidence(results)
 
         return results
 
+    def _extract_with_sentence_cache(self, texts: Iterable[str], batch_size: Optional[int] = None,
+                                     n_process: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Extract per sentence, parsing only sentences missing from the sentence cache.
+
+        Sentences are parsed on their own, so model predictions can differ slightly from
+        parsing the whole text; results are merged in the same order as ``_extract_from_doc``.
+        """
+        batch_size = batch_size or self.batch_size
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, batch_size))
+            if not chunk:
+                return
+
+            # Parts for every sentence in the chunk; missing ones are parsed together below
+            segmented = [self._split_sentences(text) for text in chunk]
+            parts = {}
+            missing = []
+            with self._sentence_cache_lock:
+                for sentences in segmented:
+                    for _, sentence in sentences:
+                        if sentence in parts:
+                            continue
+                        cached = self._sentence_cache.get(sentence)
+                        if cached is None:
+                            parts[sentence] = None
+                            missing.append(sentence)
+                        else:
+                            self._sentence_cache.move_to_end(sentence)
+                            parts[sentence] = cached
+
+            for sentence, doc in zip(missing, self.nlp.pipe(missing, batch_size=batch_size,
+                                                            n_process=n_process or self.n_process)):
+                parts[sentence] = self._sentence_parts(doc)
+            with self._sentence_cache_lock:
+                for sentence in missing:
+                    self._sentence_cache[sentence] = parts[sentence]
+                while len(self._sentence_cache) > self.sentence_cache_size:
+                    self._sentence_cache.popitem(last=False)
+
+            for sentences in segmented:
+                yield self._merge_sentence_parts([(offset, parts[sentence]) for offset, sentence in sentences])
+
+    def _split_sentences(self, text: str) -> List[Tuple[int, str]]:
+        """Split text into ``(offset, sentence)`` pairs on end punctuation and line breaks."""
+        sentences = []
+        start = 0
+        for boundary in self.sentence_boundary_pattern.finditer(text):
+            if boundary.start() > start:
+                sentences.append((start, text[start:boundary.start()]))
+            start = boundary.end()
+        if start < len(text):
+            sentences.append((start, text[start:]))
+        return sentences
+
+    def _sentence_parts(self, doc) -> Tuple:
+        """Extraction results of one parsed sentence, in a cacheable form."""
+        found = self._process_pattern_matches(doc, self._find_pattern_matches(doc))
+        contextual_skills = []
+        contextual_technologies = []
+        if self.contextual_extraction:
+            contextual_skills = self._extract_skills_contextual(doc)
+            if self.contextual_technologies:
+                contextual_technologies = self._extract_technologies_contextual(doc)
+        entities = self._extract_named_entities(doc) if self.extract_entities else []
+        return ({key: list(items) for key, items in found.items()},
+                contextual_skills, contextual_technologies, entities)
+
+    def _merge_sentence_parts(self, sentence_parts: List[Tuple[int, Tuple]]) -> Dict[str, Any]:
+        """Combine cached sentence parts into a result shaped like ``_extract_from_doc``'s."""
+        found = {key: {} for key in ('skills', 'roles', 'technologies', 'responsibilities', 'qualifications')}
+        for _, (pattern_found, _, _, _) in sentence_parts:
+            for key, items in pattern_found.items():
+                found[key].update(dict.fromkeys(items))
+
+        # Contextual results follow all pattern matches, as in a whole-document extraction
+        for _, (_, contextual_skills, contextual_technologies, _) in sentence_parts:
+            found['skills'].update(dict.fromkeys(contextual_skills))
+            found['technologies'].update(dict.fromkeys(contextual_technologies))
+
+        results = {key: list(items) for key, items in found.items()}
+        results['benefits'] = []
+
+        # Entity offsets are relative to their sentence
+        results['entities'] = [
+            {**entity, 'start': entity['start'] + offset, 'end': entity['end'] + offset}
+            for offset, (_, _, _, entities) in sentence_parts
+            for entity in entities
+        ]
+
+        results['confidence'] = self._calculate_confidence(results)
+
+        return results
+
     def _extract_named_entities(self, doc) -> List[Dict[str, Any]]:
         """Extract standard named entities."""
         entities = []
@@ -241,31 +595,22 @@ class NERExtractor:
             })
         return entities
 
-    def _process_pattern_matches(self, doc, matches) -> Dict[str, List[str]]:
-        """Process pattern matcher results."""
+    def _process_pattern_matches(self, doc, matches) -> Dict[str, Dict[str, None]]:
+        """Process pattern matcher results into insertion-ordered, de-duplicated dicts."""
         results = {
-            'skills': [],
-            'roles': [],
-            'technologies': [],
-            'responsibilities': [],
-            'qualifications': []
+            'skills': {},
+            'roles': {},
+            'technologies': {},
+            'responsibilities': {},
+            'qualifications': {}
         }
 
+        # Route by match id; matched texts are interned since the same few phrases recur across documents
+        label_targets = self._label_targets
         for match_id, start, end in matches:
-            label = self.nlp.vocab.strings[match_id]
-            span = doc[start:end]
-            text = span.text.lower().strip()
-
-            if label == "PROGRAMMING_SKILL" or label == "SOFT_SKILL":
-                results['skills'].append(text)
-            elif label == "JOB_ROLE":
-                results['roles'].append(text)
-            elif label == "TECHNOLOGY":
-                results['technologies'].append(text)
-            elif label == "RESPONSIBILITY":
-                results['responsibilities'].append(text)
-            elif label == "QUALIFICATION":
-                results['qualifications'].append(text)
+            key = label_targets.get(match_id)
+            if key is not None:
+                results[key][sys.intern(doc[start:end].text.lower().strip())] = None
 
         return results
 
@@ -274,22 +619,22 @@ class NERExtractor:
         skills = []
 
         # Look for skills in context of "experience with", "knowledge of", etc.
-        skill_contexts = ["experience with", "knowledge of", "proficient in", "skilled in", "expert in"]
-
         for sent in doc.sents:
-            sent_text = sent.text.lower()
-            for context in skill_contexts:
-                if context in sent_text:
+            # First occurrence of each context in the sentence, with the text following it
+            context_matches = {}
+            for match in self.skill_context_pattern.finditer(sent.text.lower()):
+                context_matches.setdefault(match.group(1), match.group(2))
+
+            for context in self.skill_contexts:
+                if context in context_matches:
                     # Extract potential skills after the context
-                    match = re.search(f"{context}\\s+([^.]+)", sent_text)
-                    if match:
-                        skill_text = match.group(1).strip()
-                        # Clean and split skills
-                        skill_items = [s.strip() for s in re.split(r'[,;]|\\band\\b', skill_text) if s.strip()]
-                        # Filter out very short or common words
-                        valid_skills = [skill for skill in skill_items
-                                      if len(skill) > 2 and skill not in ['and', 'or', 'the', 'of', 'in', 'to', 'for']]
-                        skills.extend(valid_skills[:3])  # Limit to 3 skills per context
+                    skill_text = context_matches[context].strip()
+                    # Clean and split skills
+                    skill_items = [s.strip() for s in self.skill_split_pattern.split(skill_text) if s.strip()]
+                    # Filter out very short or common words
+                    valid_skills = [skill for skill in skill_items
+                                  if len(skill) > 2 and skill not in ['and', 'or', 'the', 'of', 'in', 'to', 'for']]
+                    skills.extend(valid_skills[:3])  # Limit to 3 skills per context
 
         return skills
 
@@ -297,35 +642,35 @@ class NERExtractor:
         """Extract technologies using contextual analysis."""
         technologies = []
 
-        # Common technology keywords
-        tech_keywords = [
-            'framework', 'library', 'database', 'platform', 'tool', 'technology',
-            'stack', 'environment', 'system', 'software'
-        ]
+        # Compare lexeme hashes of lowercase forms instead of lowercasing token texts
+        keyword_hashes = self.tech_keyword_hashes
+        stopword_hashes = self.tech_stopword_hashes
+        head_pos = (NOUN, PROPN)
 
         for token in doc:
-            if (token.text.lower() in tech_keywords and
-                token.head.pos_ in ['NOUN', 'PROPN'] and
-                token.head.text.lower() not in tech_keywords and
-                len(token.head.text) > 2):  # Filter short words
-                tech_name = token.head.text.lower()
+            if token.lower not in keyword_hashes:
+                continue
+            head = token.head
+            if (head.pos in head_pos and
+                head.lower not in keyword_hashes and
+                len(head.text) > 2):  # Filter short words
                 # Additional filtering for common words
-                if tech_name not in ['team', 'work', 'job', 'role', 'data', 'big', 'new', 'good', 'best']:
-                    technologies.append(tech_name)
+                if head.lower not in stopword_hashes:
+                    technologies.append(head.lower_)
 
         return technologies
 
     def _calculate_confidence(self, results: Dict[str, Any]) -> float:
         """Calculate overall confidence score based on extraction results."""
-        total_extractions = sum(len(v) for k, v in results.items()
-                              if isinstance(v, list) and k != 'entities')
+        # Sizes of the extraction lists, collected in one pass
+        counts = [len(v) for k, v in results.items() if isinstance(v, list) and k != 'entities']
+        total_extractions = sum(counts)
 
         if total_extractions == 0:
             return 0.0
 
         # Higher confidence for more diverse extractions
-        extraction_types = sum(1 for k, v in results.items()
-                             if isinstance(v, list) and len(v) > 0 and k != 'entities')
+        extraction_types = len(counts) - counts.count(0)
 
         base_confidence = min(total_extractions / 10.0, 1.0)  # Max 1.0
         diversity_bonus = extraction_types / 6.0  # 6 main categories
@@ -337,9 +682,10 @@ class NERExtractor:
         logger.warning("Using fallback extraction methods")
 
         # Simple keyword-based extraction
-        skills = self._fallback_skill_extraction(text)
-        technologies = self._fallback_tech_extraction(text)
-        roles = self._fallback_role_extraction(text)
+        found = self._fallback_keyword_scan(text)
+        skills = found['skills']
+        technologies = found['technologies']
+        roles = found['roles']
 
         return {
             'skills': skills,
@@ -352,53 +698,30 @@ class NERExtractor:
             'confidence': 0.5  # Lower confidence for fallback
         }
 
-    def _fallback_skill_extraction(self, text: str) -> List[str]:
-        """Simple keyword-based skill extraction."""
-        skill_keywords = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue',
-            'machine learning', 'data science', 'sql', 'git', 'docker',
-            'aws', 'azure', 'kubernetes', 'teamwork', 'leadership',
-            'communication', 'problem solving'
-        ]
-
-        found_skills = []
+    def _fallback_keyword_scan(self, text: str) -> Dict[str, List[str]]:
+        """Find fallback keywords contained in text, per category and in keyword order."""
         text_lower = text.lower()
 
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill)
+        if self.fallback_automaton is None:
+            return {category: [keyword for keyword in keywords if keyword in text_lower]
+                    for category, keywords in self.fallback_keywords.items()}
 
-        return found_skills
+        # Single linear pass over the text for all categories
+        found = set()
+        for _, entries in self.fallback_automaton.iter(text_lower):
+            found.update(entries)
 
-    def _fallback_tech_extraction(self, text: str) -> List[str]:
-        """Simple keyword-based technology extraction."""
-        tech_keywords = [
-            'react', 'angular', 'vue', 'django', 'flask', 'spring',
-            'mysql', 'postgresql', 'mongodb', 'redis', 'docker',
-            'kubernetes', 'aws', 'azure', 'git', 'jenkins'
-        ]
-
-        found_tech = []
-        text_lower = text.lower()
+        return {category: [keyword for keyword in keywords if (category, keyword) in found]
+                for category, keywords in self.fallback_keywords.items()}
 
-        for tech in tech_keywords:
-            if tech in text_lower:
-                found_tech.append(tech)
+    def _fallback_skill_extraction(self, text: str) -> List[str]:
+        """Simple keyword-based skill extraction."""
+        return self._fallback_keyword_scan(text)['skills']
 
-        return found_tech
+    def _fallback_tech_extraction(self, text: str) -> List[str]:
+        """Simple keyword-based technology extraction."""
+        return self._fallback_keyword_scan(text)['technologies']
 
     def _fallback_role_extraction(self, text: str) -> List[str]:
         """Simple keyword-based role extraction."""
-        role_keywords = [
-            'developer', 'engineer', 'analyst', 'scientist', 'manager',
-            'architect', 'lead', 'senior', 'junior', 'intern'
-        ]
-
-        found_roles = []
-        text_lower = text.lower()
-
-        for role in role_keywords:
-            if role in text_lower:
-                found_roles.append(role)
-
-        return found_roles
+        return self._fallback_keyword_scan(text)['roles']
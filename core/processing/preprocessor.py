@@ -9,7 +9,7 @@ Handles:
 
 import re
 import html
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,8 +33,8 @@ class TextPreprocessor:
         # HTML tags
         self.html_pattern = re.compile(r'<[^>]+>')
 
-        # Multiple whitespace (spaces, tabs, newlines)
-        self.whitespace_pattern = re.compile(r'\s+')
+        # Block-level HTML tags that become line breaks; list items become bullets
+        self.block_html_pattern = re.compile(r'<br\s*/?>|</?(?:p|div|ul|ol)[^>]*>|(?P<li></?li[^>]*>)', re.IGNORECASE)
 
         # Special characters (keep only alphanumeric, spaces, and basic punctuation)
         self.special_chars_pattern = re.compile(r'[^\w\s\.\,\!\?\-\:\;\(\)\[\]\"\'\/\+\=\@\#\$\%\&\*]')
@@ -45,11 +45,30 @@ class TextPreprocessor:
         # URL pattern (for preservation during cleaning)
         self.url_pattern = re.compile(r'https?://[^\s]+|www\.[^\s]+')
 
-        # Bullet points and list markers
-        self.bullet_pattern = re.compile(r'^[\s]*[•·▪▫◦‣⁃]\s*', re.MULTILINE)
+        # Emails and URLs are kept verbatim while special characters elsewhere are removed
+        self.protected_special_pattern = re.compile(
+            f'(?P<protected>{self.email_pattern.pattern}|{self.url_pattern.pattern})|{self.special_chars_pattern.pattern}'
+        )
 
-        # Number bullets (1., 2., a), b), etc.)
-        self.number_bullet_pattern = re.compile(r'^[\s]*(?:\d+\.|\w+\)|\w+\.)\s*', re.MULTILINE)
+        # Whitespace runs spanning a line break (strips lines and drops empty ones)
+        self.line_break_pattern = re.compile(r'\s*\n\s*')
+
+        # Space before punctuation and missing space after sentence end
+        self.space_before_punct_pattern = re.compile(r'\s+([,.!?;:])')
+        self.sentence_end_pattern = re.compile(r'([.!?])\s*([A-Z])')
+
+        # Bullet points and number bullets (1., 2., a), b), etc.)
+        self.list_marker_pattern = re.compile(r'^[\s]*(?:[•·▪▫◦‣⁃]|\d+\.|\w+\)|\w+\.)\s*', re.MULTILINE)
+
+        # Common section headers patterns
+        section_flags = re.IGNORECASE | re.DOTALL
+        self.section_patterns = {
+            'requirements': re.compile(r'(?:requirements?|qualifications?|skills?)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))', section_flags),
+            'responsibilities': re.compile(r'(?:responsibilities?|duties|role)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))', section_flags),
+            'benefits': re.compile(r'(?:benefits?|perks?|we offer)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))', section_flags),
+            'about': re.compile(r'(?:about us|company|who we are)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))', section_flags),
+            'description': re.compile(r'(?:job description|role description|overview)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))', section_flags)
+        }
 
     def clean(self, text: str) -> str:
         """Main cleaning pipeline."""
@@ -79,15 +98,19 @@ class TextPreprocessor:
 
         return cleaned.strip()
 
+    def clean_batch(self, texts: Iterable[str]) -> List[str]:
+        """Clean many texts, one ``clean`` call each.
+
+        Texts aren't joined into one blob: line-anchored list markers, whitespace collapsing
+        and the final strip would run across document boundaries.
+        """
+        clean = self.clean
+        return [clean(text) for text in texts]
+
     def _remove_html(self, text: str) -> str:
         """Remove HTML tags while preserving text content."""
-        # Replace common HTML tags with appropriate spacing
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?p[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?div[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?li[^>]*>', '\n• ', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?ul[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?ol[^>]*>', '\n', text, flags=re.IGNORECASE)
+        # Replace common HTML tags with appropriate spacing in a single pass
+        text = self.block_html_pattern.sub(lambda m: '\n• ' if m.group('li') else '\n', text)
 
         # Remove all remaining HTML tags
         text = self.html_pattern.sub(' ', text)
@@ -96,69 +119,36 @@ class TextPreprocessor:
 
     def _normalize_lists(self, text: str) -> str:
         """Normalize bullet points and list formatting."""
-        # Convert various bullet symbols to standard bullet
-        text = self.bullet_pattern.sub('• ', text)
-
-        # Normalize numbered lists
-        text = self.number_bullet_pattern.sub('• ', text)
-
-        return text
+        # Convert bullet symbols and numbered list markers to standard bullet in one pass
+        return self.list_marker_pattern.sub('• ', text)
 
     def _remove_special_chars(self, text: str) -> str:
         """Remove special characters while preserving important information."""
-        # Temporarily replace emails and URLs with placeholders
-        emails = self.email_pattern.findall(text)
-        urls = self.url_pattern.findall(text)
-
-        email_placeholders = {}
-        url_placeholders = {}
-
-        for i, email in enumerate(emails):
-            placeholder = f"__EMAIL_{i}__"
-            email_placeholders[placeholder] = email
-            text = text.replace(email, placeholder)
-
-        for i, url in enumerate(urls):
-            placeholder = f"__URL_{i}__"
-            url_placeholders[placeholder] = url
-            text = text.replace(url, placeholder)
-
-        # Remove special characters
-        text = self.special_chars_pattern.sub(' ', text)
-
-        # Restore emails and URLs
-        for placeholder, email in email_placeholders.items():
-            text = text.replace(placeholder, email)
-
-        for placeholder, url in url_placeholders.items():
-            text = text.replace(placeholder, url)
-
-        return text
+        # Single pass: protected emails/URLs are returned unchanged, special characters become spaces
+        return self.protected_special_pattern.sub(lambda m: m.group('protected') or ' ', text)
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace (multiple spaces, tabs, newlines)."""
-        # Replace multiple whitespace with single space
-        text = self.whitespace_pattern.sub(' ', text)
+        # Replace multiple whitespace (newlines included) with single space; str.split
+        # uses the same whitespace definition as \s but stays out of the regex engine
+        collapsed = ' '.join(text.split())
 
-        # But preserve paragraph breaks (double newlines become single newlines)
-        text = re.sub(r'\n\s*\n', '\n', text)
+        # Keep the single leading/trailing space the regex substitution used to leave
+        if collapsed and text[0].isspace():
+            collapsed = ' ' + collapsed
+        if collapsed and text[-1].isspace():
+            collapsed += ' '
 
-        return text
+        return collapsed or (' ' if text else '')
 
     def _final_cleanup(self, text: str) -> str:
         """Final cleanup and formatting."""
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-
-        # Remove empty lines
-        lines = [line for line in lines if line]
-
-        # Join with single newlines
-        text = '\n'.join(lines)
+        # Strip each line and drop empty lines without splitting into a list
+        text = self.line_break_pattern.sub('\n', text).strip()
 
         # Fix common formatting issues
-        text = re.sub(r'\s+([,.!?;:])', r'\1', text)  # Remove space before punctuation
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # Ensure space after sentence end
+        text = self.space_before_punct_pattern.sub(r'\1', text)  # Remove space before punctuation
+        text = self.sentence_end_pattern.sub(r'\1 \2', text)  # Ensure space after sentence end
 
         return text
 
@@ -166,17 +156,8 @@ class TextPreprocessor:
         """Extract common job description sections."""
         sections = {}
 
-        # Common section headers patterns
-        section_patterns = {
-            'requirements': r'(?:requirements?|qualifications?|skills?)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))',
-            'responsibilities': r'(?:responsibilities?|duties|role)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))',
-            'benefits': r'(?:benefits?|perks?|we offer)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))',
-            'about': r'(?:about us|company|who we are)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))',
-            'description': r'(?:job description|role description|overview)\s*:?\s*\n(.*?)(?=\n(?:[A-Z][^:]*:|$))'
-        }
-
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for section_name, pattern in self.section_patterns.items():
+            match = pattern.search(text)
             if match:
                 sections[section_name] = match.group(1).strip()
 
@@ -8,8 +8,17 @@ Quy trình xử lý:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from hashlib import blake2b
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import json
 
@@ -20,8 +29,28 @@ from .keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Batches with more uncached descriptions than this run rules and keywords in worker processes
+PARALLEL_BATCH_MIN_SIZE = 32
 
-@dataclass
+# Start method for worker pools; forking a process that already runs threads (model loader,
+# bulk writers, NLP threads) can deadlock the child
+WORKER_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Per-process extractors for the worker pool, built once by the pool initializer
+_worker_extractors: Optional[Tuple[RuleBasedExtractor, KeywordMatcher]] = None
+
+
+def _init_extraction_worker(rules_config: Dict[str, Any], keywords_config: Dict[str, Any]):
+    global _worker_extractors
+    _worker_extractors = (RuleBasedExtractor(rules_config), KeywordMatcher(keywords_config))
+
+
+def _extract_rules_and_keywords(cleaned_text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    rule_extractor, keyword_matcher = _worker_extractors
+    return rule_extractor.extract(cleaned_text), keyword_matcher.match(cleaned_text)
+
+
+@dataclass(slots=True)
 class ProcessedJobInfo:
     """Kết quả xử lý chi tiết từ job description."""
     original_description: str
@@ -58,6 +87,14 @@ class ProcessedJobInfo:
     processing_time: float = 0.0
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    # Source posting metadata, set by callers that process stored jobs (not part of to_dict)
+    job_id: Optional[str] = None
+    job_title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    url: Optional[str] = None
+    source: Optional[str] = None
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'original_description': self.original_description,
@@ -86,12 +123,33 @@ class ProcessedJobInfo:
         }
 
 
+class CacheInfo(NamedTuple):
+    """Result cache statistics, in the shape of ``functools.lru_cache``'s."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class JobDescriptionProcessor:
     """Main processor orchestrating the entire NLP pipeline."""
 
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
 
+        # LRU of processed results keyed by a digest of the raw description; reposts hit it
+        self._cache: "OrderedDict[bytes, ProcessedJobInfo]" = OrderedDict()
+        self._cache_max = self.config.get('performance', {}).get('cache_size', 1024)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_lock = threading.Lock()
+
+        # Worker processes for large batches, never more than there are CPUs
+        cpu_count = os.cpu_count() or 1
+        self.max_workers = min(self.config.get('performance', {}).get('max_workers') or cpu_count, cpu_count)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
         # Initialize pipeline components
         self.preprocessor = TextPreprocessor(self.config.get('preprocessing', {}))
         self.rule_extractor = RuleBasedExtractor(self.config.get('rules', {}))
@@ -118,7 +176,8 @@ class JobDescriptionProcessor:
             'ner': {
                 'model_name': 'en_core_web_sm',
                 'custom_entities': True,
-                'confidence_threshold': 0.7
+                'confidence_threshold': 0.7,
+                'use_gpu': False
             },
             'keywords': {
                 'skills_dict_path': 'data/skills_dictionary.json',
@@ -138,68 +197,96 @@ class JobDescriptionProcessor:
 
         return default_config
 
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the extraction worker pool on first use; it is reused until ``close()``."""
+        with self._pool_lock:
+            if self._pool is None:
+                self.ner_extractor.wait_until_loaded()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+                    initializer=_init_extraction_worker,
+                    initargs=(self.config.get('rules', {}), self.config.get('keywords', {}))
+                )
+            return self._pool
+
+    def close(self):
+        """Shut down the extraction worker pool, if one was started."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def __del__(self):
+        if getattr(self, '_pool', None) is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def cache_info(self) -> CacheInfo:
+        """Report result cache hits, misses, capacity and current size."""
+        return CacheInfo(self._cache_hits, self._cache_misses, self._cache_max, len(self._cache))
+
+    def cache_clear(self):
+        """Drop all cached results and reset the statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = self._cache_misses = 0
+
+    @staticmethod
+    def _cache_key(description: str) -> bytes:
+        return blake2b(description.encode('utf-8'), digest_size=16).digest()
+
+    @staticmethod
+    def _copy_result(result: ProcessedJobInfo, **changes) -> ProcessedJobInfo:
+        """Deep-copy a result so callers can't mutate the cached entry's lists and dicts."""
+        return replace(deepcopy(result), **changes)
+
+    def _cache_lookup(self, key: bytes, start_time: float) -> Optional[ProcessedJobInfo]:
+        """Return a private copy of a cached result with fresh metadata, or None on a miss."""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self._cache_misses += 1
+                return None
+
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+        return self._copy_result(cached, timestamp=datetime.now().isoformat(),
+                                 processing_time=time.perf_counter() - start_time)
+
+    def _cache_store(self, key: bytes, result: ProcessedJobInfo):
+        if self._cache_max <= 0:
+            return
+        # Cache a copy taken before the caller sets per-job metadata (job_id, url, ...) on the result
+        result = self._copy_result(result)
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
     def process(self, description: str) -> ProcessedJobInfo:
-        """Process a single job description through the complete pipeline."""
-        start_time = datetime.now()
+        """Process a single job description through the complete pipeline.
+
+        Descriptions seen before are answered from the result cache.
+        """
+        # perf_counter floats: monotonic and cheaper than datetime arithmetic
+        start_time = time.perf_counter()
+        key = self._cache_key(description)
+        cached = self._cache_lookup(key, start_time)
+        if cached is not None:
+            return cached
 
         try:
             # Step 1: Preprocessing
             logger.debug("Starting preprocessing...")
             cleaned_text = self.preprocessor.clean(description)
 
-            # Step 2: Rule-based extraction
-            logger.debug("Starting rule-based extraction...")
-            rule_results = self.rule_extractor.extract(cleaned_text)
-
-            # Step 3: NER extraction
+            # Step 2: NER extraction
             logger.debug("Starting NER extraction...")
             ner_results = self.ner_extractor.extract(cleaned_text)
 
-            # Step 4: Keyword matching
-            logger.debug("Starting keyword matching...")
-            keyword_results = self.keyword_matcher.match(cleaned_text)
-
-            # Combine results
-            result = ProcessedJobInfo(
-                original_description=description,
-                cleaned_text=cleaned_text,
-
-                # Rule-based
-                dates=rule_results.get('dates', []),
-                durations=rule_results.get('durations', []),
-                emails=rule_results.get('emails', []),
-                urls=rule_results.get('urls', []),
-                phone_numbers=rule_results.get('phone_numbers', []),
-
-                # NER
-                skills=ner_results.get('skills', []),
-                roles=ner_results.get('roles', []),
-                technologies=ner_results.get('technologies', []),
-                responsibilities=ner_results.get('responsibilities', []),
-                qualifications=ner_results.get('qualifications', []),
-                benefits=ner_results.get('benefits', []),
-
-                # Keywords
-                matched_skills=keyword_results.get('skills', []),
-                matched_technologies=keyword_results.get('technologies', []),
-                matched_soft_skills=keyword_results.get('soft_skills', []),
-                matched_industry_terms=keyword_results.get('industry_terms', []),
-
-                # Vietnamese and extended matching
-                vietnamese_keywords=keyword_results.get('vietnamese_keywords', []),
-                seniority_levels=keyword_results.get('seniority_levels', []),
-                extended_technologies=keyword_results.get('extended_technologies', []),
-
-                # Metadata
-                confidence_scores={
-                    'ner_confidence': ner_results.get('confidence', 0.0),
-                    'keyword_confidence': keyword_results.get('confidence', 0.0),
-                    'total_matches': keyword_results.get('total_matches', 0)
-                },
-                processing_time=(datetime.now() - start_time).total_seconds()
-            )
-
-            logger.info(f"Successfully processed job description in {result.processing_time:.2f}s")
+            result = self._build_result(description, cleaned_text, ner_results, start_time)
+            self._cache_store(key, result)
             return result
 
         except Exception as e:
@@ -207,14 +294,112 @@ class JobDescriptionProcessor:
             return ProcessedJobInfo(
                 original_description=description,
                 cleaned_text="",
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=time.perf_counter() - start_time
             )
 
-    def process_batch(self, descriptions: List[str]) -> List[ProcessedJobInfo]:
-        """Process multiple job descriptions."""
-        results = []
-        for i, desc in enumerate(descriptions):
-            logger.info(f"Processing job description {i+1}/{len(descriptions)}")
-            result = self.process(desc)
-            results.append(result)
-        return results
+    def process_batch(self, descriptions: List[str], batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None) -> List[ProcessedJobInfo]:
+        """Process multiple job descriptions, running NER over them with ``nlp.pipe``.
+
+        ``batch_size`` and ``n_process`` default to the ``ner`` config. Cached descriptions
+        and repeats within the batch are processed only once. Large batches run rule extraction
+        and keyword matching in ``performance.max_workers`` processes while NER runs here.
+        """
+        start_time = time.perf_counter()
+
+        try:
+            keys = [self._cache_key(desc) for desc in descriptions]
+            results = [self._cache_lookup(key, start_time) for key in keys]
+
+            # Positions of each uncached description, grouped so repeats are processed once
+            pending: Dict[bytes, List[int]] = {}
+            for i, (key, result) in enumerate(zip(keys, results)):
+                if result is None:
+                    pending.setdefault(key, []).append(i)
+
+            positions = list(pending.values())
+            cleaned_texts = self.preprocessor.clean_batch(descriptions[indices[0]] for indices in positions)
+
+            extracted = None
+            if len(cleaned_texts) > PARALLEL_BATCH_MIN_SIZE and self.max_workers > 1:
+                chunksize = max(1, len(cleaned_texts) // (self.max_workers * 4))
+                extracted = self._get_pool().map(_extract_rules_and_keywords, cleaned_texts, chunksize=chunksize)
+
+            ner_batch = self.ner_extractor.extract_batch(cleaned_texts, batch_size=batch_size, n_process=n_process)
+
+            for n, (indices, cleaned_text) in enumerate(zip(positions, cleaned_texts)):
+                logger.debug("Processing job description %d/%d", n + 1, len(positions))
+                item_start = time.perf_counter()
+                ner_results = next(ner_batch)
+                rule_results, keyword_results = next(extracted) if extracted else (None, None)
+                result = self._build_result(descriptions[indices[0]], cleaned_text, ner_results, item_start,
+                                            rule_results, keyword_results)
+                self._cache_store(keys[indices[0]], result)
+                results[indices[0]] = result
+                for i in indices[1:]:
+                    results[i] = self._copy_result(result)
+            return results
+
+        except Exception as e:
+            logger.error(f"Error processing job description batch, falling back to single processing: {e}")
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; start a fresh pool on the next large batch
+                self.close()
+            return [self.process(desc) for desc in descriptions]
+
+    def _build_result(self, description: str, cleaned_text: str, ner_results: Dict[str, Any],
+                      start_time: float, rule_results: Optional[Dict[str, Any]] = None,
+                      keyword_results: Optional[Dict[str, Any]] = None) -> ProcessedJobInfo:
+        """Run rule extraction and keyword matching unless already done, then combine all results."""
+        # Step 3: Rule-based extraction
+        if rule_results is None:
+            logger.debug("Starting rule-based extraction...")
+            rule_results = self.rule_extractor.extract(cleaned_text)
+
+        # Step 4: Keyword matching
+        if keyword_results is None:
+            logger.debug("Starting keyword matching...")
+            keyword_results = self.keyword_matcher.match(cleaned_text)
+
+        # Combine results
+        result = ProcessedJobInfo(
+            original_description=description,
+            cleaned_text=cleaned_text,
+
+            # Rule-based
+            dates=rule_results.get('dates', []),
+            durations=rule_results.get('durations', []),
+            emails=rule_results.get('emails', []),
+            urls=rule_results.get('urls', []),
+            phone_numbers=rule_results.get('phone_numbers', []),
+
+            # NER
+            skills=ner_results.get('skills', []),
+            roles=ner_results.get('roles', []),
+            technologies=ner_results.get('technologies', []),
+            responsibilities=ner_results.get('responsibilities', []),
+            qualifications=ner_results.get('qualifications', []),
+            benefits=ner_results.get('benefits', []),
+
+            # Keywords
+            matched_skills=keyword_results.get('skills', []),
+            matched_technologies=keyword_results.get('technologies', []),
+            matched_soft_skills=keyword_results.get('soft_skills', []),
+            matched_industry_terms=keyword_results.get('industry_terms', []),
+
+            # Vietnamese and extended matching
+            vietnamese_keywords=keyword_results.get('vietnamese_keywords', []),
+            seniority_levels=keyword_results.get('seniority_levels', []),
+            extended_technologies=keyword_results.get('extended_technologies', []),
+
+            # Metadata
+            confidence_scores={
+                'ner_confidence': ner_results.get('confidence', 0.0),
+                'keyword_confidence': keyword_results.get('confidence', 0.0),
+                'total_matches': keyword_results.get('total_matches', 0)
+            },
+            processing_time=time.perf_counter() - start_time
+        )
+
+        logger.debug("Successfully processed job description in %.2fs", result.processing_time)
+        return result
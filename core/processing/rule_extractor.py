@@ -12,6 +12,19 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
+# Try to import RE2 for linear-time matching, fallback to re if not available
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,38 +39,49 @@ class RuleBasedExtractor:
         self.extract_phone = self.config.get('extract_phone', True)
         self.extract_salary = self.config.get('extract_salary', True)
         self.extract_work_arrangement = self.config.get('extract_work_arrangement', True)
+        self.use_re2 = self.config.get('use_re2', False)
+
+        if self.use_re2 and not RE2_AVAILABLE:
+            logger.warning("google-re2 not available. Rule patterns will use the re module.")
+            self.use_re2 = False
 
         self._compile_patterns()
 
     def _compile_patterns(self):
         """Compile all regex patterns for efficiency."""
 
+        # Each category is one alternation so the text is scanned once per category.
+        # At a given position the first alternative that matches wins, so more
+        # specific alternatives come before the ones they contain.
+
         # Date patterns
-        self.date_patterns = [
+        self.date_pattern = self._combine_patterns([
             # Standard formats: 01/01/2024, 1-1-2024, 01.01.2024
-            re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b'),
-            re.compile(r'\b\d{1,2}\.\d{1,2}\.\d{4}\b'),
+            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',
+            r'\b\d{1,2}\.\d{1,2}\.\d{4}\b',
 
             # Month year: January 2024, Jan 2024
-            re.compile(r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b', re.IGNORECASE),
+            r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b',
 
             # Relative dates: immediately, ASAP, within 2 weeks
-            re.compile(r'\b(?:immediately|asap|urgent|within\s+\d+\s+(?:days?|weeks?|months?))\b', re.IGNORECASE),
-        ]
+            r'\b(?:immediately|asap|urgent|within\s+\d+\s+(?:days?|weeks?|months?))\b',
+        ], re.IGNORECASE)
 
         # Duration patterns
-        self.duration_patterns = [
-            # X years experience, 2-5 years, 3+ years
-            re.compile(r'\b\d+[-+]?\s*(?:to\s+\d+\s*)?years?\s*(?:of\s*)?(?:experience|exp)\b', re.IGNORECASE),
-            re.compile(r'\b\d+\s*[-–]\s*\d+\s*years?\b', re.IGNORECASE),
-            re.compile(r'\b\d+\+?\s*years?\b', re.IGNORECASE),
+        self.duration_pattern = self._combine_patterns([
+            # X years experience, 3+ years experience
+            r'\b\d+[-+]?\s*(?:to\s+\d+\s*)?years?\s*(?:of\s*)?(?:experience|exp)\b',
 
             # Months experience
-            re.compile(r'\b\d+[-+]?\s*(?:to\s+\d+\s*)?months?\s*(?:of\s*)?(?:experience|exp)\b', re.IGNORECASE),
+            r'\b\d+[-+]?\s*(?:to\s+\d+\s*)?months?\s*(?:of\s*)?(?:experience|exp)\b',
 
             # Contract duration
-            re.compile(r'\b(?:\d+\s*(?:month|year)s?\s*contract|contract\s*(?:for\s*)?\d+\s*(?:month|year)s?)\b', re.IGNORECASE),
-        ]
+            r'\b(?:\d+\s*(?:month|year)s?\s*contract|contract\s*(?:for\s*)?\d+\s*(?:month|year)s?)\b',
+
+            # 2-5 years, 3+ years
+            r'\b\d+\s*[-–]\s*\d+\s*years?\b',
+            r'\b\d+\+?\s*years?\b',
+        ], re.IGNORECASE)
 
         # Email pattern
         self.email_pattern = re.compile(
@@ -66,56 +90,89 @@ class RuleBasedExtractor:
         )
 
         # URL patterns
-        self.url_patterns = [
-            re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE),
-            re.compile(r'www\.[^\s<>"{}|\\^`\[\]]+', re.IGNORECASE),
-        ]
+        self.url_pattern = self._combine_patterns([
+            r'https?://[^\s<>"{}|\\^`\[\]]+',
+            r'www\.[^\s<>"{}|\\^`\[\]]+',
+        ], re.IGNORECASE)
 
         # Phone number patterns (multiple formats)
-        self.phone_patterns = [
+        self.phone_pattern = self._combine_patterns([
             # (XXX) XXX-XXXX, XXX-XXX-XXXX
-            re.compile(r'\b\(\d{3}\)\s*\d{3}[-\s]?\d{4}\b'),
-            re.compile(r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b'),
+            r'\b\(\d{3}\)\s*\d{3}[-\s]?\d{4}\b',
+            r'\b\d{3}[-\s]?\d{3}[-\s]?\d{4}\b',
 
             # International: +1-XXX-XXX-XXXX, +84-XXX-XXX-XXXX
-            re.compile(r'\+\d{1,3}[-\s]?\d{1,4}[-\s]?\d{1,4}[-\s]?\d{1,9}'),
+            r'\+\d{1,3}[-\s]?\d{1,4}[-\s]?\d{1,4}[-\s]?\d{1,9}',
 
             # Vietnamese phone: 0901234567, (+84) 901234567
-            re.compile(r'(?:\+84|0)\d{9,10}\b'),
-        ]
+            r'(?:\+84|0)\d{9,10}\b',
+        ])
+
+        # Every duration, phone and salary pattern needs a digit; texts without one skip them
+        self.digit_pattern = re.compile(r'\d')
 
         # Salary patterns
-        self.salary_patterns = [
-            # $50,000 - $70,000, $50K-70K, 50-70k USD
-            re.compile(r'\$\d{1,3}(?:,\d{3})*(?:\s*[-–]\s*\$?\d{1,3}(?:,\d{3})*)?(?:\s*(?:USD|usd|per\s*year|annually|pa))?', re.IGNORECASE),
-            re.compile(r'\$\d{1,3}[kK](?:\s*[-–]\s*\$?\d{1,3}[kK])?', re.IGNORECASE),
-            re.compile(r'\b\d{1,3}[kK]?\s*[-–]\s*\d{1,3}[kK]?\s*(?:USD|usd|dollars?|per\s*year|annually)\b', re.IGNORECASE),
+        self.salary_pattern = self._combine_patterns([
+            # Hourly rates: $25/hour, $15-25 per hour
+            r'\$\d{1,3}(?:\s*[-–]\s*\$?\d{1,3})?\s*(?:per\s*hour|/hour|/hr|hourly)',
 
-            # Vietnamese currency: 10-15 triệu VND, 10tr-15tr
-            re.compile(r'\b\d{1,3}(?:\s*[-–]\s*\d{1,3})?\s*(?:triệu|tr|million)\s*(?:VND|vnd|đồng)?\b', re.IGNORECASE),
+            # $50K-70K, $50,000 - $70,000, 50-70k USD
+            r'\$\d{1,3}[kK](?:\s*[-–]\s*\$?\d{1,3}[kK])?',
+            r'\$\d{1,3}(?:,\d{3})*(?:\s*[-–]\s*\$?\d{1,3}(?:,\d{3})*)?(?:\s*(?:USD|usd|per\s*year|annually|pa))?',
+            r'\b\d{1,3}[kK]?\s*[-–]\s*\d{1,3}[kK]?\s*(?:USD|usd|dollars?|per\s*year|annually)\b',
 
-            # Hourly rates: $25/hour, $15-25 per hour
-            re.compile(r'\$\d{1,3}(?:\s*[-–]\s*\$?\d{1,3})?\s*(?:per\s*hour|/hour|/hr|hourly)', re.IGNORECASE),
-        ]
+            # Vietnamese currency: 10-15 triệu VND, 10tr-15tr
+            r'\b\d{1,3}(?:\s*[-–]\s*\d{1,3})?\s*(?:triệu|tr|million)\s*(?:VND|vnd|đồng)?\b',
+        ], re.IGNORECASE)
 
         # Work arrangement patterns
-        self.work_arrangement_patterns = [
-            re.compile(r'\b(?:remote|work\s*from\s*home|wfh|telecommute|telework)\b', re.IGNORECASE),
-            re.compile(r'\b(?:hybrid|flexible|mixed)\b', re.IGNORECASE),
-            re.compile(r'\b(?:on-site|onsite|office|in-person)\b', re.IGNORECASE),
-            re.compile(r'\b(?:full-time|fulltime|full\s*time|ft)\b', re.IGNORECASE),
-            re.compile(r'\b(?:part-time|parttime|part\s*time|pt)\b', re.IGNORECASE),
-            re.compile(r'\b(?:contract|contractor|freelance|temporary|temp)\b', re.IGNORECASE),
+        self.work_arrangement_pattern = self._combine_patterns([
+            r'\b(?:remote|work\s*from\s*home|wfh|telecommute|telework)\b',
+            r'\b(?:hybrid|flexible|mixed)\b',
+            r'\b(?:on-site|onsite|office|in-person)\b',
+            r'\b(?:full-time|fulltime|full\s*time|ft)\b',
+            r'\b(?:part-time|parttime|part\s*time|pt)\b',
+            r'\b(?:contract|contractor|freelance|temporary|temp)\b',
+        ], re.IGNORECASE)
+
+        # Literal forms of the work arrangement pattern (single-space separators), found in
+        # one Aho-Corasick pass when available. No form starts at a word boundary inside another.
+        self.work_arrangement_terms = [
+            'remote', 'work from home', 'workfrom home', 'work fromhome', 'workfromhome', 'wfh',
+            'telecommute', 'telework', 'hybrid', 'flexible', 'mixed',
+            'on-site', 'onsite', 'office', 'in-person',
+            'full-time', 'fulltime', 'full time', 'ft', 'part-time', 'parttime', 'part time', 'pt',
+            'contract', 'contractor', 'freelance', 'temporary', 'temp',
         ]
+        self.work_arrangement_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.work_arrangement_automaton = ahocorasick.Automaton()
+            for term in self.work_arrangement_terms:
+                self.work_arrangement_automaton.add_word(term, term)
+            self.work_arrangement_automaton.make_automaton()
 
         # Education level patterns
-        self.education_patterns = [
-            re.compile(r'\b(?:bachelor\'?s?|ba|bs|undergraduate)\s*(?:degree)?\b', re.IGNORECASE),
-            re.compile(r'\b(?:master\'?s?|ma|ms|mba|graduate)\s*(?:degree)?\b', re.IGNORECASE),
-            re.compile(r'\b(?:phd|ph\.d|doctorate|doctoral)\s*(?:degree)?\b', re.IGNORECASE),
-            re.compile(r'\b(?:associate\'?s?|aa|as)\s*(?:degree)?\b', re.IGNORECASE),
-            re.compile(r'\b(?:high\s*school|diploma|ged)\b', re.IGNORECASE),
-        ]
+        self.education_pattern = self._combine_patterns([
+            r'\b(?:bachelor\'?s?|ba|bs|undergraduate)\s*(?:degree)?\b',
+            r'\b(?:master\'?s?|ma|ms|mba|graduate)\s*(?:degree)?\b',
+            r'\b(?:phd|ph\.d|doctorate|doctoral)\s*(?:degree)?\b',
+            r'\b(?:associate\'?s?|aa|as)\s*(?:degree)?\b',
+            r'\b(?:high\s*school|diploma|ged)\b',
+        ], re.IGNORECASE)
+
+    def _combine_patterns(self, patterns: List[str], flags: int = 0) -> Any:
+        """Compile patterns into one alternation; they must not use capturing groups.
+
+        With ``use_re2`` the alternation is compiled by RE2, which matches in linear time
+        but treats only ASCII letters and digits as word characters for ``\\b``.
+        """
+        combined = '|'.join(f'(?:{pattern})' for pattern in patterns)
+        if self.use_re2:
+            # RE2 takes flags inline only
+            if flags & re.IGNORECASE:
+                combined = '(?i)' + combined
+            return re2.compile(combined)
+        return re.compile(combined, flags)
 
     def extract(self, text: str) -> Dict[str, List[str]]:
         """Extract all information from text."""
@@ -147,79 +204,104 @@ class RuleBasedExtractor:
 
     def extract_dates_info(self, text: str) -> List[str]:
         """Extract date information."""
-        dates = []
-        for pattern in self.date_patterns:
-            matches = pattern.findall(text)
-            dates.extend(matches)
+        dates = self.date_pattern.findall(text)
 
         # Remove duplicates while preserving order
-        return list(dict.fromkeys(dates))
+        return self._dedup_ci(dates)
 
     def extract_durations(self, text: str) -> List[str]:
         """Extract duration/experience requirements."""
-        durations = []
-        for pattern in self.duration_patterns:
-            matches = pattern.findall(text)
-            durations.extend(matches)
+        if not self.digit_pattern.search(text):
+            return []
+
+        durations = self.duration_pattern.findall(text)
 
-        return list(dict.fromkeys(durations))
+        return self._dedup_ci(durations)
 
     def extract_emails_info(self, text: str) -> List[str]:
         """Extract email addresses."""
+        if '@' not in text:
+            return []
+
         emails = self.email_pattern.findall(text)
-        return list(dict.fromkeys(emails))
+        return self._dedup_ci(emails)
 
     def extract_urls_info(self, text: str) -> List[str]:
         """Extract URLs."""
-        urls = []
-        for pattern in self.url_patterns:
-            matches = pattern.findall(text)
-            urls.extend(matches)
+        # Matches need "://" or a case-insensitive "www."
+        if '://' not in text and 'www.' not in text.lower():
+            return []
+
+        urls = self.url_pattern.findall(text)
 
+        # URL paths are case-sensitive, so only exact repeats are dropped
         return list(dict.fromkeys(urls))
 
     def extract_phone_numbers(self, text: str) -> List[str]:
         """Extract phone numbers."""
-        phones = []
-        for pattern in self.phone_patterns:
-            matches = pattern.findall(text)
-            phones.extend(matches)
+        if not self.digit_pattern.search(text):
+            return []
+
+        phones = self.phone_pattern.findall(text)
 
-        # Clean up phone numbers
-        cleaned_phones = []
-        for phone in phones:
-            # Remove extra spaces and standardize format
-            cleaned = re.sub(r'\s+', '-', phone.strip())
-            cleaned_phones.append(cleaned)
+        # Clean up phone numbers: strip and turn each whitespace run into a dash
+        cleaned_phones = ['-'.join(phone.split()) for phone in phones]
 
-        return list(dict.fromkeys(cleaned_phones))
+        return self._dedup_ci(cleaned_phones)
 
     def extract_salary_info(self, text: str) -> List[str]:
         """Extract salary information."""
-        salaries = []
-        for pattern in self.salary_patterns:
-            matches = pattern.findall(text)
-            salaries.extend(matches)
+        if not self.digit_pattern.search(text):
+            return []
 
-        return list(dict.fromkeys(salaries))
+        salaries = self.salary_pattern.findall(text)
+
+        return self._dedup_ci(salaries)
 
     def extract_work_arrangements(self, text: str) -> List[str]:
         """Extract work arrangement information."""
-        arrangements = []
-        for pattern in self.work_arrangement_patterns:
-            matches = pattern.findall(text)
-            arrangements.extend(matches)
-
-        return list(dict.fromkeys([arr.lower() for arr in arrangements]))
+        if self.work_arrangement_automaton is not None:
+            lowered = text.lower()
+            # Offsets only carry over when lowercasing keeps the length
+            if len(lowered) == len(text):
+                return list(dict.fromkeys(self._find_whole_words(self.work_arrangement_automaton, lowered)))
+
+        arrangements = self.work_arrangement_pattern.findall(text)
+
+        return [arr.lower() for arr in self._dedup_ci(arrangements)]
+
+    @staticmethod
+    def _dedup_ci(items: List[str]) -> List[str]:
+        """Drop repeats that differ only in case, keeping the first spelling in order."""
+        seen = set()
+        unique = []
+        for item in items:
+            key = item.lower()
+            if key not in seen:
+                seen.add(key)
+                unique.append(item)
+        return unique
+
+    @staticmethod
+    def _find_whole_words(automaton, text: str) -> List[str]:
+        """Return automaton terms found in text with a word boundary on both sides, in order."""
+        terms = []
+        last = len(text) - 1
+        for end, term in automaton.iter(text):
+            start = end - len(term) + 1
+            # Same word characters as re's \b: alphanumerics and underscore
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            if end < last and (text[end + 1].isalnum() or text[end + 1] == '_'):
+                continue
+            terms.append(term)
+        return terms
 
     def extract_education_levels(self, text: str) -> List[str]:
         """Extract education level requirements."""
-        education = []
-        for pattern in self.education_patterns:
-            matches = pattern.findall(text)
-            education.extend(matches)
+        education = self.education_pattern.findall(text)
 
-        return list(dict.fromkeys([edu.lower() for edu in education]))
+        return [edu.lower() for edu in self._dedup_ci(education)]
 
     def extract_contact_info(self, text: str) -> Dict[str, List[str]]:
         """Extract all contact information."""
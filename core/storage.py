@@ -1,40 +1,75 @@
 """Lưu CSV/DB"""
 import logging
-from typing import List, Union
-from pymongo import MongoClient
-from dataclasses import asdict, is_dataclass
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from pymongo import MongoClient, WriteConcern
+from pymongo.errors import BulkWriteError
+from dataclasses import fields, is_dataclass
 from sites.base_site import JobPosting
 
 logger = logging.getLogger("storage")
 logger.setLevel(logging.INFO)
 
+# Số document tối đa trong một lần insert_many
+INSERT_CHUNK_SIZE = 1000
+
 
 class JobStorage:
-    def __init__(self, uri: str = "mongodb://localhost:27017/", db_name: str = "crawler", collection: str = "demo"):
-        self.client = MongoClient(uri)
+    def __init__(self, uri: str = "mongodb://localhost:27017/", db_name: str = "crawler", collection: str = "demo",
+                 unacknowledged_writes: bool = False, max_pool_size: int = 100, compressors: Optional[str] = None):
+        """compressors: ví dụ "zstd,snappy,zlib" (zstd/snappy cần cài thêm thư viện), hữu ích khi DB ở xa."""
+        client_options = {'maxPoolSize': max_pool_size}
+        if compressors:
+            client_options['compressors'] = compressors
+        self.client = MongoClient(uri, **client_options)
         self.db = self.client[db_name]
         self.collection = self.db[collection]
+        # w=0 bỏ qua round-trip xác nhận khi ghi hàng loạt, nhưng lỗi ghi sẽ không được báo về
+        self._write_collection = self.collection
+        if unacknowledged_writes:
+            self._write_collection = self.collection.with_options(write_concern=WriteConcern(w=0))
+        # Tên field của từng kiểu dataclass, tính một lần
+        self._field_names: Dict[type, Tuple[str, ...]] = {}
 
     def _to_dict(self, job: Union[JobPosting, dict]) -> dict:
         """Convert JobPosting/dataclass hoặc dict sang dict chuẩn để lưu DB."""
         if is_dataclass(job):
-            return asdict(job)
+            # Chỉ copy field cấp trên cùng: BSON encode giá trị lồng nhau, không cần deepcopy như asdict
+            names = self._field_names.get(type(job))
+            if names is None:
+                names = self._field_names[type(job)] = tuple(f.name for f in fields(job))
+            return {name: getattr(job, name) for name in names}
         elif isinstance(job, dict):
             return job
         else:
             raise TypeError(f"Không hỗ trợ kiểu dữ liệu: {type(job)}")
 
-    def save_jobs(self, jobs: List[Union[JobPosting, dict]]):
-        if not jobs:
+    def save_jobs(self, jobs: Iterable[Union[JobPosting, dict]]):
+        """Lưu jobs (list hoặc iterator); chỉ giữ trong bộ nhớ một chunk document mỗi lần."""
+        docs = (self._to_dict(job) for job in jobs)
+
+        # Ghi theo từng chunk, ordered=False để một document lỗi không chặn các document còn lại
+        inserted = 0
+        failed = 0
+        total = 0
+        while True:
+            chunk = list(islice(docs, INSERT_CHUNK_SIZE))
+            if not chunk:
+                break
+            total += len(chunk)
+            try:
+                inserted += len(self._write_collection.insert_many(chunk, ordered=False).inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get('nInserted', 0)
+                failed += len(e.details.get('writeErrors', []))
+
+        if not total:
             logger.warning("Không có job nào để lưu")
             return
 
-        docs = [self._to_dict(job) for job in jobs]
-        if docs:
-            self.collection.insert_many(docs)
-            logger.info(f"Đã lưu {len(docs)} jobs vào MongoDB ({self.collection.full_name})")
-        else:
-            logger.warning("Danh sách jobs sau khi convert rỗng")
+        logger.info(f"Đã lưu {inserted} jobs vào MongoDB ({self.collection.full_name})")
+        if failed:
+            logger.warning(f"{failed} jobs không lưu được (lỗi ghi, ví dụ trùng _id)")
 
     def get_jobs(self, source: str = None, limit: int = None) -> List[dict]:
         """Lấy jobs từ MongoDB với filter và limit."""
@@ -8,13 +8,23 @@ This module:
 4. Enhanced with Vietnamese keywords, seniority levels, and extended technologies
 """
 
+import argparse
 import logging
+import multiprocessing
+import os
 import sys
-from typing import List, Dict, Any, Optional
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from pymongo import UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, PyMongoError
 from core.storage import JobStorage
-from core.processing.processor import JobDescriptionProcessor, ProcessedJobInfo
+from core.processing.processor import JobDescriptionProcessor, ProcessedJobInfo, WORKER_START_METHOD
 from vietnamese_enhancement_report import generate_final_report
 # Add project root to path
 project_root = Path(__file__).parent
@@ -24,6 +34,30 @@ sys.path.insert(0, str(project_root))
 
 logger = logging.getLogger(__name__)
 
+# Enriched-job updates sent per bulk_write
+WRITE_BATCH_SIZE = 500
+# Jobs fetched per cursor round-trip
+CURSOR_BATCH_SIZE = 200
+# URLs per $in query in process_specific_jobs
+URL_QUERY_BATCH_SIZE = 1000
+# Jobs per process_batch call, and batches queued ahead of each NLP worker
+JOB_BATCH_SIZE = 256
+BATCHES_IN_FLIGHT = 2
+# Per-job details kept in the process_all_jobs summary
+JOB_DETAILS_LIMIT = 100
+# Seconds statistics query results are reused between menu actions
+STATS_CACHE_TTL = 60
+# Shorter descriptions (after trimming whitespace) are skipped
+MIN_DESCRIPTION_LENGTH = 50
+# Job fields the NLP pipeline and enrichment read; the rest of the document stays in MongoDB
+JOB_PROJECTION = {"_id": 1, "title": 1, "company": 1, "location": 1, "url": 1, "source": 1, "description": 1}
+
+
+@lru_cache(maxsize=4)
+def _get_nlp_processor(config_file: Optional[str]) -> JobDescriptionProcessor:
+    """Shared NLP processor per config file, so each LinkedInJobProcessor doesn't reload the models."""
+    return JobDescriptionProcessor(config_file)
+
 
 class LinkedInJobProcessor:
     """Process LinkedIn job descriptions and save enriched data with Vietnamese support."""
@@ -34,93 +68,134 @@ class LinkedInJobProcessor:
         db_name: str = "crawler",
         input_collection: str = "demo",
         output_collection: str = "processed_jobs",
-        config_path: Optional[str] = None
+        config_path: Optional[str] = None,
+        worker: bool = False
     ):
+        """``worker`` processors skip index creation and the banner; the parent already did both."""
+        # Constructor arguments, for building the same processor in worker processes
+        self._init_args = {
+            "mongo_uri": mongo_uri,
+            "db_name": db_name,
+            "input_collection": input_collection,
+            "output_collection": output_collection,
+            "config_path": config_path
+        }
         self.storage = JobStorage(mongo_uri, db_name, input_collection)
         self.output_storage = JobStorage(mongo_uri, db_name, output_collection)
+        # Enrichment updates are acknowledged by the primary alone; a replica set's default
+        # majority write concern would wait on secondaries for every bulk write
+        self._update_collection = self.storage.collection.with_options(write_concern=WriteConcern(w=1))
 
         # Initialize enhanced NLP processor
         config_file = config_path or str(project_root / "core" / "processing" / "config.json")
-        self.nlp_processor = JobDescriptionProcessor(config_file if Path(config_file).exists() else None)
+        self.nlp_processor = _get_nlp_processor(config_file if Path(config_file).exists() else None)
+
+        # Recent statistics query results by name: (time, result); cleared whenever jobs are saved
+        self._stats_cache: Dict[str, Tuple[float, Any]] = {}
+
+        if worker:
+            return
+
+        self._ensure_indexes()
 
         logger.info(f"LinkedInJobProcessor initialized - Input: {input_collection}, Output: {output_collection}")
         print(f"🇻🇳 Enhanced with Vietnamese keywords support")
 
-    def process_all_jobs(self, limit: Optional[int] = None, skip_processed: bool = True) -> Dict[str, Any]:
-        """Process all jobs in the input collection with enhanced Vietnamese support."""
+    def _ensure_indexes(self):
+        """Create the indexes the job queries rely on; existing ones are left as they are."""
+        try:
+            # The processed-job lookup joins the output collection on url
+            self.storage.collection.create_index("url")
+            self.output_storage.collection.create_index("url")
+
+            # Statistics count LinkedIn jobs and analysed jobs, and group jobs by Vietnamese keyword
+            self.storage.collection.create_index([("source", 1), ("vietnamese_analysis_completed", 1)])
+            self.storage.collection.create_index("vietnamese_analysis_completed")
+            self.storage.collection.create_index(
+                [("extracted.vietnamese_keywords.keyword", 1)],
+                partialFilterExpression={"extracted.vietnamese_keywords": {"$exists": True}}
+            )
+        except PyMongoError as e:
+            logger.warning(f"Could not create indexes: {e}")
+
+    def process_all_jobs(self, limit: Optional[int] = None, skip_processed: bool = True,
+                         n_processes: int = 1) -> Dict[str, Any]:
+        """Process all jobs in the input collection with enhanced Vietnamese support.
+
+        With ``n_processes`` > 1 (-1 for one per CPU) batches run in that many worker processes,
+        each with its own NLP pipeline and MongoDB client.
+        """
         try:
             # Get jobs from database
             jobs = self._get_jobs_to_process(limit, skip_processed)
 
-            if not jobs:
+            first_job = next(jobs, None)
+            if first_job is None:
                 logger.info("No jobs to process")
                 return {"processed": 0, "errors": 0, "skipped": 0}
 
-            logger.info(f"Processing {len(jobs)} job descriptions with Vietnamese keywords...")
+            logger.info("Processing job descriptions with Vietnamese keywords...")
 
             # Process jobs
+            start = time.perf_counter()
             results = {
                 "processed": 0,
                 "errors": 0,
                 "skipped": 0,
                 "start_time": datetime.now().isoformat(),
-                "job_details": [],
+                # Details of the most recent jobs only, so long runs don't grow without bound
+                "job_details": deque(maxlen=JOB_DETAILS_LIMIT),
                 # Enhanced stats
                 "vietnamese_detected": 0,
                 "seniority_detected": 0,
                 "extended_tech_detected": 0
             }
 
-            for i, job in enumerate(jobs):
-                try:
-                    logger.info(f"Processing job {i+1}/{len(jobs)}: {job.get('title', 'Unknown')}")
-
-                    # Process description with enhanced NLP
-                    processed_result = self._process_single_job(job)
-
-                    if processed_result:
-                        # Save to output collection with enhanced data
-                        enriched_job = self._create_enriched_job(job, processed_result)
-                        self._save_processed_job(enriched_job)
+            # Batches are processed and saved in a background thread, or in worker processes with
+            # n_processes > 1; only per-job summaries come back here, in job order
+            if n_processes == -1:
+                n_processes = os.cpu_count() or 1
+            if n_processes > 1:
+                # Workers build their own processor and don't inherit this process's threads,
+                # open cursor or MongoClients
+                executor = ProcessPoolExecutor(max_workers=n_processes,
+                                               mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+                                               initializer=_init_job_worker, initargs=(self._init_args,))
+                task = _process_and_save_in_worker
+                max_in_flight = n_processes * BATCHES_IN_FLIGHT
+            else:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nlp')
+                task = self._process_and_save_batch
+                max_in_flight = BATCHES_IN_FLIGHT
+
+            with executor:
+                for summaries, errors in self._run_batches(executor, task, chain([first_job], jobs), max_in_flight):
+                    results["errors"] += errors
+                    for details in summaries:
+                        if details is None:
+                            results["skipped"] += 1
+                            continue
 
                         results["processed"] += 1
 
                         # Track Vietnamese enhancements
-                        if processed_result.vietnamese_keywords:
+                        extractions = details["extractions"]
+                        if extractions["vietnamese_keywords"]:
                             results["vietnamese_detected"] += 1
-                        if processed_result.seniority_levels:
+                        if extractions["seniority_levels"]:
                             results["seniority_detected"] += 1
-                        if processed_result.extended_technologies:
+                        if extractions["extended_technologies"]:
                             results["extended_tech_detected"] += 1
 
-                        results["job_details"].append({
-                            "title": job.get('title', 'Unknown'),
-                            "company": job.get('company', 'Unknown'),
-                            "processing_time": processed_result.processing_time,
-                            "extractions": {
-                                "skills": len(processed_result.skills),
-                                "technologies": len(processed_result.technologies),
-                                "roles": len(processed_result.roles),
-                                "responsibilities": len(processed_result.responsibilities),
-                                # Enhanced extractions
-                                "vietnamese_keywords": len(processed_result.vietnamese_keywords),
-                                "seniority_levels": len(processed_result.seniority_levels),
-                                "extended_technologies": len(processed_result.extended_technologies)
-                            },
-                            # Show sample Vietnamese keywords
-                            "sample_vietnamese": [kw.get('keyword', '') for kw in processed_result.vietnamese_keywords[:3]],
-                            "sample_seniority": [s.get('keyword', '') for s in processed_result.seniority_levels[:2]]
-                        })
-                    else:
-                        results["skipped"] += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing job {i+1}: {e}")
-                    results["errors"] += 1
+                        results["job_details"].append(details)
+
+                    logger.info("Processed %d jobs so far", results["processed"] + results["skipped"])
+
+            self._stats_cache.clear()
 
+            results["job_details"] = list(results["job_details"])
             results["end_time"] = datetime.now().isoformat()
-            results["total_time"] = (datetime.fromisoformat(results["end_time"]) -
-                                   datetime.fromisoformat(results["start_time"])).total_seconds()
+            results["total_time"] = time.perf_counter() - start
 
             logger.info(f"Processing complete: {results['processed']} processed, {results['errors']} errors, {results['skipped']} skipped")
             logger.info(f"Vietnamese enhancements: {results['vietnamese_detected']} VN keywords, {results['seniority_detected']} seniority, {results['extended_tech_detected']} extended tech")
@@ -132,88 +207,93 @@ class LinkedInJobProcessor:
 
     def _get_comprehensive_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics about processed jobs."""
-        print(f"\n=== Comprehensive Vietnamese Keywords Statistics ===")
+        out = [f"\n=== Comprehensive Vietnamese Keywords Statistics ==="]
 
         # Overall statistics
-        total_linkedin_jobs = self.storage.collection.count_documents({'source': 'linkedin'})
-        processed_jobs = self.storage.collection.count_documents({'vietnamese_analysis_completed': True})
-        jobs_with_vn = self.storage.collection.count_documents({
-            'extracted.vietnamese_keywords': {'$exists': True, '$not': {'$size': 0}}
-        })
-
-        print(f"\n📊 OVERVIEW")
-        print(f"Total LinkedIn jobs: {total_linkedin_jobs}")
-        print(f"Processed with Vietnamese analysis: {processed_jobs}")
-        print(f"Jobs containing Vietnamese keywords: {jobs_with_vn}")
+        total_linkedin_jobs, processed_jobs, jobs_with_vn = self._cached_query('overview', lambda: (
+            self.storage.collection.count_documents({'source': 'linkedin'}),
+            self.storage.collection.count_documents({'vietnamese_analysis_completed': True}),
+            self.storage.collection.count_documents({
+                'extracted.vietnamese_keywords': {'$exists': True, '$not': {'$size': 0}}
+            })
+        ))
+
+        out.append(f"\n📊 OVERVIEW")
+        out.append(f"Total LinkedIn jobs: {total_linkedin_jobs}")
+        out.append(f"Processed with Vietnamese analysis: {processed_jobs}")
+        out.append(f"Jobs containing Vietnamese keywords: {jobs_with_vn}")
         if processed_jobs > 0:
-            print(f"Coverage: {(processed_jobs/total_linkedin_jobs*100):.1f}%")
-            print(f"Vietnamese detection rate: {(jobs_with_vn/processed_jobs*100):.1f}%")
+            out.append(f"Coverage: {(processed_jobs/total_linkedin_jobs*100):.1f}%")
+            out.append(f"Vietnamese detection rate: {(jobs_with_vn/processed_jobs*100):.1f}%")
 
-        # Get detailed analysis
-        vn_jobs = list(self.storage.collection.find({
-            'extracted.vietnamese_keywords': {'$exists': True, '$not': {'$size': 0}}
-        }))
+        # Tally seniority levels and keyword categories of jobs with Vietnamese keywords on the
+        # server, in one pass; only the counts and three sample jobs come back
+        pipeline = [
+            {'$match': {'extracted.vietnamese_keywords': {'$exists': True, '$not': {'$size': 0}}}},
+            {'$facet': {
+                'seniority_counts': self._count_facet('extracted.seniority_levels', 'keyword'),
+                'vn_categories': self._count_facet('extracted.vietnamese_keywords', 'category'),
+                'tech_categories': self._count_facet('extracted.extended_technologies', 'category'),
+                'sample_jobs': [
+                    {'$limit': 3},
+                    {'$project': {
+                        'title': 1,
+                        'company': 1,
+                        'extracted.vietnamese_keywords': 1,
+                        'extracted.seniority_levels': 1
+                    }}
+                ]
+            }}
+        ]
+        facets = self._cached_query('facets', lambda: next(self.storage.collection.aggregate(pipeline)))
 
-        if not vn_jobs:
-            print("No jobs with Vietnamese keywords found.")
+        sample_jobs = facets['sample_jobs']
+        if not sample_jobs:
+            out.append("No jobs with Vietnamese keywords found.")
+            self._write_lines(out)
             return {"total_jobs": total_linkedin_jobs, "processed": processed_jobs, "vietnamese": 0}
 
-        # Analyze seniority levels
-        seniority_counts = {}
-        vn_category_counts = {}
-        tech_category_counts = {}
-
-        for job in vn_jobs:
-            # Count seniority levels
-            for seniority in job.get('extracted', {}).get('seniority_levels', []):
-                keyword = seniority.get('keyword', 'Unknown')
-                seniority_counts[keyword] = seniority_counts.get(keyword, 0) + 1
-
-            # Count Vietnamese categories
-            for vn_kw in job.get('extracted', {}).get('vietnamese_keywords', []):
-                category = vn_kw.get('category', 'Unknown')
-                vn_category_counts[category] = vn_category_counts.get(category, 0) + 1
-
-            # Count tech categories
-            for tech in job.get('extracted', {}).get('extended_technologies', []):
-                category = tech.get('category', 'Unknown')
-                tech_category_counts[category] = tech_category_counts.get(category, 0) + 1
+        # Counts arrive sorted by frequency
+        seniority_counts = {r['_id']: r['count'] for r in facets['seniority_counts']}
+        vn_category_counts = {r['_id']: r['count'] for r in facets['vn_categories']}
+        tech_category_counts = {r['_id']: r['count'] for r in facets['tech_categories']}
 
         # Display seniority statistics
         if seniority_counts:
-            print(f"\n🎯 SENIORITY LEVELS")
-            for keyword, count in sorted(seniority_counts.items(), key=lambda x: x[1], reverse=True):
+            out.append(f"\n🎯 SENIORITY LEVELS")
+            for keyword, count in seniority_counts.items():
                 percentage = (count / jobs_with_vn * 100)
-                print(f"  {keyword:<15} │ {count:>3} jobs │ {percentage:>5.1f}%")
+                out.append(f"  {keyword:<15} │ {count:>3} jobs │ {percentage:>5.1f}%")
 
         # Display Vietnamese categories
         if vn_category_counts:
-            print(f"\n🇻🇳 VIETNAMESE KEYWORDS")
-            for category, count in sorted(vn_category_counts.items(), key=lambda x: x[1], reverse=True):
-                print(f"  {category:<25} │ {count:>3} mentions")
+            out.append(f"\n🇻🇳 VIETNAMESE KEYWORDS")
+            for category, count in vn_category_counts.items():
+                out.append(f"  {category:<25} │ {count:>3} mentions")
 
         # Display tech categories
         if tech_category_counts:
-            print(f"\n💻 TECHNOLOGY CATEGORIES")
-            top_tech_categories = sorted(tech_category_counts.items(), key=lambda x: x[1], reverse=True)[:8]
+            out.append(f"\n💻 TECHNOLOGY CATEGORIES")
+            top_tech_categories = list(tech_category_counts.items())[:8]
             for category, count in top_tech_categories:
-                print(f"  {category:<25} │ {count:>3} mentions")
+                out.append(f"  {category:<25} │ {count:>3} mentions")
 
         # Show sample jobs
-        print(f"\n📝 SAMPLE JOBS WITH VIETNAMESE CONTENT")
-        sample_jobs = vn_jobs[:3]
+        out.append(f"\n📝 SAMPLE JOBS WITH VIETNAMESE CONTENT")
         for i, job in enumerate(sample_jobs, 1):
             title = job.get('title', 'Untitled')[:40]
             company = job.get('company', 'Unknown')[:30]
 
-            vn_keywords = [kw['keyword'] for kw in job.get('extracted', {}).get('vietnamese_keywords', [])]
-            seniority = [s['keyword'] for s in job.get('extracted', {}).get('seniority_levels', [])]
+            extracted = job.get('extracted') or {}
+            vn_keywords = [kw['keyword'] for kw in extracted.get('vietnamese_keywords', ())]
+            seniority = [s['keyword'] for s in extracted.get('seniority_levels', ())]
 
-            print(f"\n  {i}. {title}...")
-            print(f"     Company: {company}")
-            print(f"     Vietnamese: {vn_keywords[:4]}")
-            print(f"     Seniority: {seniority}")
+            out.append(f"\n  {i}. {title}...")
+            out.append(f"     Company: {company}")
+            out.append(f"     Vietnamese: {vn_keywords[:4]}")
+            out.append(f"     Seniority: {seniority}")
 
+        self._write_lines(out)
         return {
             "total_jobs": total_linkedin_jobs,
             "processed": processed_jobs,
@@ -223,9 +303,34 @@ class LinkedInJobProcessor:
             "tech_categories": tech_category_counts
         }
 
+    def _cached_query(self, name: str, query: Callable[[], Any]) -> Any:
+        """Run a statistics query, reusing its result for ``STATS_CACHE_TTL`` seconds."""
+        now = time.monotonic()
+        cached = self._stats_cache.get(name)
+        if cached and now - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+
+        result = query()
+        self._stats_cache[name] = (now, result)
+        return result
+
+    @staticmethod
+    def _write_lines(lines: List[str]):
+        """Print a report's lines with a single write rather than a print per line."""
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+    @staticmethod
+    def _count_facet(field: str, key: str) -> List[Dict[str, Any]]:
+        """$facet branch counting array items of ``field`` by ``key``, most frequent first."""
+        return [
+            {'$unwind': f'${field}'},
+            {'$group': {'_id': {'$ifNull': [f'${field}.{key}', 'Unknown']}, 'count': {'$sum': 1}}},
+            {'$sort': {'count': -1, '_id': 1}}
+        ]
+
     def show_detailed_analysis(self) -> None:
         """Show detailed analysis of Vietnamese keywords and job insights."""
-        print(f"\n=== Detailed Vietnamese Keywords Analysis ===")
+        out = [f"\n=== Detailed Vietnamese Keywords Analysis ==="]
 
         # Get jobs with Vietnamese keywords
         pipeline = [
@@ -248,57 +353,58 @@ class LinkedInJobProcessor:
             }
         ]
 
-        detailed_jobs = list(self.storage.collection.aggregate(pipeline))
+        detailed_jobs = self._cached_query('detailed_jobs', lambda: list(self.storage.collection.aggregate(pipeline)))
 
         if not detailed_jobs:
-            print("No detailed data available.")
+            out.append("No detailed data available.")
+            self._write_lines(out)
             return
 
-        print(f"Found {len(detailed_jobs)} jobs with detailed Vietnamese analysis")
+        out.append(f"Found {len(detailed_jobs)} jobs with detailed Vietnamese analysis")
 
         # Analyze keyword combinations
-        keyword_combinations = {}
-        for job in detailed_jobs:
-            vn_keywords = [kw['keyword'] for kw in job.get('extracted', {}).get('vietnamese_keywords', [])]
-            seniority = [s['keyword'] for s in job.get('extracted', {}).get('seniority_levels', [])]
-
-            # Create combination key
-            if vn_keywords or seniority:
-                key = f"{'+'.join(sorted(seniority))}"
-                if vn_keywords:
-                    vn_filtered = [kw for kw in vn_keywords if kw not in seniority]
-                    if vn_filtered:
-                        key += f"|{'+'.join(sorted(vn_filtered)[:2])}"
-
-                keyword_combinations[key] = keyword_combinations.get(key, 0) + 1
+        keyword_combinations = Counter(
+            key for key in map(self._keyword_combination, detailed_jobs) if key is not None
+        )
 
         # Show top combinations
-        print(f"\n🔗 TOP KEYWORD COMBINATIONS")
-        top_combinations = sorted(keyword_combinations.items(), key=lambda x: x[1], reverse=True)[:10]
-        for combo, count in top_combinations:
-            print(f"  {combo:<30} │ {count:>2} jobs")
+        out.append(f"\n🔗 TOP KEYWORD COMBINATIONS")
+        for combo, count in keyword_combinations.most_common(10):
+            out.append(f"  {combo:<30} │ {count:>2} jobs")
 
         # Company analysis
-        company_vn_stats = {}
+        company_jobs = Counter()
+        company_vn_keywords = Counter()
         for job in detailed_jobs:
             company = job.get('company', 'Unknown')
-            vn_count = len(job.get('extracted', {}).get('vietnamese_keywords', []))
+            company_jobs[company] += 1
+            company_vn_keywords[company] += len((job.get('extracted') or {}).get('vietnamese_keywords', ()))
 
-            if company not in company_vn_stats:
-                company_vn_stats[company] = {'jobs': 0, 'vn_keywords': 0}
+        # Show companies with most Vietnamese content
+        out.append(f"\n🏢 COMPANIES WITH MOST VIETNAMESE CONTENT")
+        for company, vn_keywords in company_vn_keywords.most_common(5):
+            jobs = company_jobs[company]
+            avg_vn = vn_keywords / jobs if jobs > 0 else 0
+            company_name = company[:25] if company != 'Unknown' else 'Unknown'
+            out.append(f"  {company_name:<25} │ {jobs:>2} jobs │ {avg_vn:>4.1f} avg VN")
 
-            company_vn_stats[company]['jobs'] += 1
-            company_vn_stats[company]['vn_keywords'] += vn_count
+        self._write_lines(out)
 
-        # Show companies with most Vietnamese content
-        print(f"\n🏢 COMPANIES WITH MOST VIETNAMESE CONTENT")
-        sorted_companies = sorted(company_vn_stats.items(),
-                                key=lambda x: x[1]['vn_keywords'], reverse=True)[:5]
+    @staticmethod
+    def _keyword_combination(job: Dict[str, Any]) -> Optional[str]:
+        """Combination key of a job's seniority levels and first two other Vietnamese keywords."""
+        extracted = job.get('extracted') or {}
+        vn_keywords = [kw['keyword'] for kw in extracted.get('vietnamese_keywords', ())]
+        seniority = [s['keyword'] for s in extracted.get('seniority_levels', ())]
+        if not vn_keywords and not seniority:
+            return None
 
-        for company, stats in sorted_companies:
-            avg_vn = stats['vn_keywords'] / stats['jobs'] if stats['jobs'] > 0 else 0
-            company_name = company[:25] if company != 'Unknown' else 'Unknown'
-            print(f"  {company_name:<25} │ {stats['jobs']:>2} jobs │ {avg_vn:>4.1f} avg VN")
+        key = f"{'+'.join(sorted(seniority))}"
+        if vn_keywords:
+            vn_filtered = [kw for kw in vn_keywords if kw not in seniority]
+            if vn_filtered:
+                key += f"|{'+'.join(sorted(vn_filtered)[:2])}"
+        return key
 
     def quick_test(self, sample_size: int = 3) -> None:
         """Quick test with a few sample jobs."""
@@ -334,136 +440,181 @@ class LinkedInJobProcessor:
                 print(f"Seniority Levels: {seniority}")
                 print(f"Technologies: {technologies}")
             else:
-                vn_keywords = [kw['keyword'] for kw in job.get('extracted', {}).get('vietnamese_keywords', [])]
-                seniority = [s['keyword'] for s in job.get('extracted', {}).get('seniority_levels', [])]
+                extracted = job.get('extracted') or {}
+                vn_keywords = [kw['keyword'] for kw in extracted.get('vietnamese_keywords', ())]
+                seniority = [s['keyword'] for s in extracted.get('seniority_levels', ())]
 
                 print(f"Vietnamese Keywords (cached): {vn_keywords}")
                 print(f"Seniority Levels (cached): {seniority}")
 
-    def process_all_jobs(self, limit: Optional[int] = None, skip_processed: bool = True) -> Dict[str, Any]:
-        """Process all jobs in the input collection."""
-        try:
-            # Get jobs from database
-            jobs = self._get_jobs_to_process(limit, skip_processed)
-
-            if not jobs:
-                logger.info("No jobs to process")
-                return {"processed": 0, "errors": 0, "skipped": 0}
-
-            logger.info(f"Processing {len(jobs)} job descriptions...")
-
-            # Process jobs
-            results = {
-                "processed": 0,
-                "errors": 0,
-                "skipped": 0,
-                "start_time": datetime.now().isoformat(),
-                "job_details": []
-            }
-
-            for i, job in enumerate(jobs):
-                try:
-                    logger.info(f"Processing job {i+1}/{len(jobs)}: {job.get('title', 'Unknown')}")
-
-                    # Process description
-                    processed_result = self._process_single_job(job)
-
-                    if processed_result:
-                        # Save to output collection
-                        enriched_job = self._create_enriched_job(job, processed_result)
-                        self._save_processed_job(enriched_job)
-
-                        results["processed"] += 1
-                        results["job_details"].append({
-                            "title": job.get('title', 'Unknown'),
-                            "company": job.get('company', 'Unknown'),
-                            "processing_time": processed_result.processing_time,
-                            "extractions": {
-                                "skills": len(processed_result.skills),
-                                "technologies": len(processed_result.technologies),
-                                "roles": len(processed_result.roles),
-                                "responsibilities": len(processed_result.responsibilities)
-                            }
-                        })
-                    else:
-                        results["skipped"] += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing job {i+1}: {e}")
-                    results["errors"] += 1
+    @staticmethod
+    def _run_batches(executor: Executor, task: Callable[[List[Dict[str, Any]]], Any],
+                     jobs: Iterable[Dict[str, Any]], max_in_flight: int) -> Iterator[Any]:
+        """Run ``task`` on batches of jobs on the executor, yielding its results in job order.
+
+        Only ``max_in_flight`` batches are pending at once, so the cursor is read as work completes.
+        """
+        in_flight: "deque[Future]" = deque()
+        for batch in iter(lambda: list(islice(jobs, JOB_BATCH_SIZE)), []):
+            in_flight.append(executor.submit(task, batch))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+    def _process_and_save_batch(self, jobs: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], int]:
+        """Process a batch of jobs and save the enrichment with one bulk write.
+
+        Returns the details of each processed job (None for skipped ones) and the error count.
+        """
+        summaries = []
+        updates = []
+        errors = 0
+        for job, processed_result in zip(jobs, self._process_job_batch(jobs)):
+            try:
+                logger.debug("Processing job: %s", job.get('title') or 'Unknown')
+                if not processed_result:
+                    summaries.append(None)
+                    continue
+
+                # Save to output collection with enhanced data
+                job_id, update_doc = self._create_enriched_job(job, processed_result)
+                update = self._build_update(job_id, update_doc)
+                if update:
+                    updates.append(update)
+                summaries.append(self._job_details(job, processed_result))
 
-            results["end_time"] = datetime.now().isoformat()
-            results["total_time"] = (datetime.fromisoformat(results["end_time"]) -
-                                   datetime.fromisoformat(results["start_time"])).total_seconds()
+            except Exception as e:
+                logger.error(f"Error processing job {job.get('title', 'Unknown')}: {e}")
+                errors += 1
 
-            logger.info(f"Processing complete: {results['processed']} processed, {results['errors']} errors, {results['skipped']} skipped")
-            return results
+        return summaries, errors + self._flush_updates(updates)
 
-        except Exception as e:
-            logger.error(f"Error in process_all_jobs: {e}")
-            raise
+    @staticmethod
+    def _job_details(job: Dict[str, Any], processed_result: ProcessedJobInfo) -> Dict[str, Any]:
+        return {
+            "title": job.get('title', 'Unknown'),
+            "company": job.get('company', 'Unknown'),
+            "processing_time": processed_result.processing_time,
+            "extractions": {
+                "skills": len(processed_result.skills),
+                "technologies": len(processed_result.technologies),
+                "roles": len(processed_result.roles),
+                "responsibilities": len(processed_result.responsibilities),
+                # Enhanced extractions
+                "vietnamese_keywords": len(processed_result.vietnamese_keywords),
+                "seniority_levels": len(processed_result.seniority_levels),
+                "extended_technologies": len(processed_result.extended_technologies)
+            },
+            # Show sample Vietnamese keywords
+            "sample_vietnamese": [kw.get('keyword', '') for kw in processed_result.vietnamese_keywords[:3]],
+            "sample_seniority": [s.get('keyword', '') for s in processed_result.seniority_levels[:2]]
+        }
 
-    def _get_jobs_to_process(self, limit: Optional[int], skip_processed: bool) -> List[Dict[str, Any]]:
-        """Get jobs from database that need processing."""
+    def _get_jobs_to_process(self, limit: Optional[int], skip_processed: bool) -> Iterator[Dict[str, Any]]:
+        """Stream jobs from database that need processing."""
         try:
-            # Query for jobs with descriptions
-            query = {"description": {"$exists": True, "$nin": ["", None]}}
+            # Query for jobs with descriptions long enough to process, checked on the server
+            query = {"$expr": {"$and": [
+                {"$eq": [{"$type": "$description"}, "string"]},
+                {"$gte": [{"$strLenCP": {"$trim": {"input": "$description"}}}, MIN_DESCRIPTION_LENGTH]}
+            ]}}
 
             if skip_processed:
-                # Skip jobs that have already been processed
-                processed_urls = set()
-                for doc in self.output_storage.collection.find({}, {"url": 1}):
-                    if doc.get("url"):
-                        processed_urls.add(doc["url"])
-
-                if processed_urls:
-                    query["url"] = {"$nin": list(processed_urls)}
+                # Skip jobs whose URL is already in the output collection, joined on the server
+                # so the processed URLs never leave the database; jobs without a URL are kept
+                pipeline = [
+                    {"$match": query},
+                    {"$project": JOB_PROJECTION},
+                    {"$lookup": {
+                        "from": self.output_storage.collection.name,
+                        # let + $expr rather than localField/foreignField with a pipeline,
+                        # which needs MongoDB 5.0; this form works from 3.6
+                        "let": {"url": "$url"},
+                        # Only whether a match exists matters; don't pull the processed documents
+                        "pipeline": [
+                            {"$match": {"$expr": {"$eq": ["$url", "$$url"]}}},
+                            {"$limit": 1},
+                            {"$project": {"_id": 1}}
+                        ],
+                        "as": "_processed"
+                    }},
+                    {"$match": {"$or": [{"url": {"$in": [None, ""]}}, {"_processed": {"$size": 0}}]}},
+                    {"$project": {"_processed": 0}}
+                ]
+                if limit:
+                    pipeline.append({"$limit": limit})
+                cursor = self.storage.collection.aggregate(pipeline, allowDiskUse=True,
+                                                  batchSize=CURSOR_BATCH_SIZE)
+            else:
+                # Get jobs from database
+                cursor = self.storage.collection.find(query, JOB_PROJECTION).batch_size(CURSOR_BATCH_SIZE)
 
-            # Get jobs from database
-            cursor = self.storage.collection.find(query)
+                if limit:
+                    cursor = cursor.limit(limit)
 
-            if limit:
-                cursor = cursor.limit(limit)
+            return cursor
 
-            jobs = list(cursor)
-            logger.info(f"Found {len(jobs)} jobs to process")
+        except Exception as e:
+            logger.error(f"Error querying jobs: {e}")
+            return iter([])
 
-            return jobs
+    def _process_job_batch(self, jobs: List[Dict[str, Any]]) -> List[Optional[ProcessedJobInfo]]:
+        """Process a batch of jobs with one ``process_batch`` call; None for skipped jobs."""
+        results: List[Optional[ProcessedJobInfo]] = [None] * len(jobs)
+        positions = [i for i, job in enumerate(jobs) if self._has_description(job)]
 
+        try:
+            # Process through NLP pipeline
+            processed = self.nlp_processor.process_batch([jobs[i]['description'] for i in positions])
         except Exception as e:
-            logger.error(f"Error querying jobs: {e}")
-            return []
+            logger.error(f"Error processing job batch, processing jobs one by one: {e}")
+            return [self._process_single_job(job) for job in jobs]
+
+        for i, result in zip(positions, processed):
+            results[i] = self._add_job_metadata(result, jobs[i])
+        return results
 
     def _process_single_job(self, job: Dict[str, Any]) -> Optional[ProcessedJobInfo]:
         """Process a single job description."""
-        description = job.get('description', '')
-
-        if not description or len(description.strip()) < 50:
-            logger.warning(f"Job {job.get('title', 'Unknown')} has insufficient description")
+        if not self._has_description(job):
             return None
 
         try:
             # Process through NLP pipeline
-            result = self.nlp_processor.process(description)
-
-            # Add job metadata
-            result.job_id = str(job.get('_id', ''))
-            result.job_title = job.get('title', '')
-            result.company = job.get('company', '')
-            result.location = job.get('location', '')
-            result.url = job.get('url', '')
-            result.source = job.get('source', 'linkedin')
-
-            return result
+            result = self.nlp_processor.process(job['description'])
+            return self._add_job_metadata(result, job)
 
         except Exception as e:
             logger.error(f"Error processing job description: {e}")
             return None
 
-    def _create_enriched_job(self, original_job: Dict[str, Any], processed_info: ProcessedJobInfo) -> Dict[str, Any]:
-        """Create enriched job document combining original data with NLP results."""
-        # Start with original job data
-        enriched = original_job.copy()
+    @staticmethod
+    def _has_description(job: Dict[str, Any]) -> bool:
+        description = job.get('description', '')
+
+        if not description or len(description.strip()) < MIN_DESCRIPTION_LENGTH:
+            logger.warning(f"Job {job.get('title', 'Unknown')} has insufficient description")
+            return False
+        return True
+
+    @staticmethod
+    def _add_job_metadata(result: ProcessedJobInfo, job: Dict[str, Any]) -> ProcessedJobInfo:
+        result.job_id = str(job.get('_id', ''))
+        result.job_title = job.get('title', '')
+        result.company = job.get('company', '')
+        result.location = job.get('location', '')
+        result.url = job.get('url', '')
+        result.source = job.get('source', 'linkedin')
+        return result
+
+    def _create_enriched_job(self, original_job: Dict[str, Any],
+                             processed_info: ProcessedJobInfo) -> Tuple[Any, Dict[str, Any]]:
+        """Return the job's ``_id`` and the NLP fields to ``$set`` on it.
+
+        Only new fields are built, so the original document is neither copied nor written back.
+        """
+        enriched = {}
 
         # Add processing metadata
         enriched['processing'] = {
@@ -520,219 +671,309 @@ class LinkedInJobProcessor:
             'extended_technologies_count': len(processed_info.extended_technologies)
         }
 
-        # Store cleaned description
-        enriched['description_cleaned'] = processed_info.cleaned_text
+        # Store cleaned description, unless cleaning left the description as it was
+        if processed_info.cleaned_text != processed_info.original_description:
+            enriched['description_cleaned'] = processed_info.cleaned_text
 
-        return enriched
+        return original_job.get('_id'), enriched
 
-    def _save_processed_job(self, enriched_job: Dict[str, Any]):
-        """Update the original job with processed data."""
-        try:
-            # Get the original job ID
-            job_id = enriched_job.get('_id')
-            if not job_id:
-                logger.error("No job ID found for updating")
-                return
-
-            # Prepare update data (without _id)
-            update_data = {k: v for k, v in enriched_job.items() if k != '_id'}
-
-            # Update the original job in place
-            result = self.storage.collection.update_one(
-                {'_id': job_id},
-                {'$set': update_data}
-            )
+    def _build_update(self, job_id: Any, update_doc: Dict[str, Any]) -> Optional[UpdateOne]:
+        """Build the bulk update that writes processed data onto the original job."""
+        if not job_id:
+            logger.error("No job ID found for updating")
+            return None
 
-            if result.modified_count > 0:
-                logger.debug(f"Successfully updated job {job_id}")
-            else:
-                logger.warning(f"Job {job_id} was not updated")
+        update = {'$set': update_doc}
+        if 'description_cleaned' not in update_doc:
+            # Don't leave a cleaned copy from an earlier run next to an unchanged description
+            update['$unset'] = {'description_cleaned': ''}
+        return UpdateOne({'_id': job_id}, update)
 
-        except Exception as e:
-            logger.error(f"Error saving processed job: {e}")
-            raise
+    def _flush_updates(self, updates: List[UpdateOne]) -> int:
+        """Send queued updates in one unordered bulk_write and clear the queue.
+
+        Returns the number of updates that failed.
+        """
+        if not updates:
+            return 0
+
+        try:
+            result = self._update_collection.bulk_write(updates, ordered=False)
+            logger.debug(f"Bulk updated {result.modified_count}/{len(updates)} jobs")
+            return 0
+        except BulkWriteError as e:
+            write_errors = e.details.get('writeErrors', [])
+            logger.error(f"Bulk update failed for {len(write_errors)}/{len(updates)} jobs")
+            return len(write_errors)
+        except PyMongoError as e:
+            logger.error(f"Error saving processed jobs: {e}")
+            return len(updates)
+        finally:
+            updates.clear()
 
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get statistics about processed jobs."""
         try:
-            total_processed = self.output_storage.collection.count_documents({})
-
-            # Get average processing time
+            # Averages and top skills/technologies in one pass over the collection, reused for
+            # STATS_CACHE_TTL seconds so polling dashboards don't re-run it
             pipeline = [
-                {"$group": {
-                    "_id": None,
-                    "avg_processing_time": {"$avg": "$processing.processing_time"},
-                    "avg_skills_count": {"$avg": "$extraction_stats.total_skills"},
-                    "avg_tech_count": {"$avg": "$extraction_stats.total_technologies"},
-                    "avg_confidence": {"$avg": "$processing.confidence_scores.ner_confidence"}
+                {"$facet": {
+                    "averages": [
+                        {"$group": {
+                            "_id": None,
+                            "avg_processing_time": {"$avg": "$processing.processing_time"},
+                            "avg_skills_count": {"$avg": "$extraction_stats.total_skills"},
+                            "avg_tech_count": {"$avg": "$extraction_stats.total_technologies"},
+                            "avg_confidence": {"$avg": "$processing.confidence_scores.ner_confidence"}
+                        }}
+                    ],
+                    "top_skills": self._top_items_stages("extracted.skills"),
+                    "top_technologies": self._top_items_stages("extracted.technologies")
                 }}
             ]
 
-            stats = list(self.output_storage.collection.aggregate(pipeline))
+            total_processed, facets = self._cached_query('processing_statistics', lambda: (
+                self.output_storage.collection.count_documents({}),
+                next(self.output_storage.collection.aggregate(pipeline, allowDiskUse=True))
+            ))
 
-            result = {
+            return {
                 "total_processed": total_processed,
-                "averages": stats[0] if stats else {}
+                "averages": facets["averages"][0] if facets["averages"] else {},
+                "top_skills": [{"item": r["_id"], "count": r["count"]} for r in facets["top_skills"]],
+                "top_technologies": [{"item": r["_id"], "count": r["count"]} for r in facets["top_technologies"]]
             }
 
-            # Get top skills and technologies
-            result["top_skills"] = self._get_top_extracted_items("extracted.skills")
-            result["top_technologies"] = self._get_top_extracted_items("extracted.technologies")
-
-            return result
-
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
             return {}
 
-    def _get_top_extracted_items(self, field: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get top extracted items across all processed jobs."""
-        try:
-            pipeline = [
-                {"$unwind": f"${field}"},
-                {"$group": {
-                    "_id": f"${field}",
-                    "count": {"$sum": 1}
-                }},
-                {"$sort": {"count": -1}},
-                {"$limit": limit}
-            ]
-
-            results = list(self.output_storage.collection.aggregate(pipeline))
-            return [{"item": r["_id"], "count": r["count"]} for r in results]
-
-        except Exception as e:
-            logger.error(f"Error getting top items for {field}: {e}")
-            return []
+    @staticmethod
+    def _top_items_stages(field: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Pipeline stages for the most frequent items of an array field across processed jobs."""
+        return [
+            {"$unwind": f"${field}"},
+            {"$sortByCount": f"${field}"},
+            {"$limit": limit}
+        ]
 
     def process_specific_jobs(self, job_urls: List[str]) -> Dict[str, Any]:
         """Process specific jobs by their URLs."""
-        query = {"url": {"$in": job_urls}}
-        jobs = list(self.storage.collection.find(query))
-
-        logger.info(f"Processing {len(jobs)} specific jobs")
-
-        results = {"processed": 0, "errors": 0, "not_found": len(job_urls) - len(jobs)}
-
+        # Query in URL chunks so each $in stays small however long the list is
+        job_urls = list(dict.fromkeys(job_urls))
+        jobs = chain.from_iterable(
+            self.storage.collection.find(
+                {"url": {"$in": job_urls[i:i + URL_QUERY_BATCH_SIZE]}}, JOB_PROJECTION
+            ).batch_size(CURSOR_BATCH_SIZE)
+            for i in range(0, len(job_urls), URL_QUERY_BATCH_SIZE)
+        )
+
+        results = {"processed": 0, "errors": 0, "not_found": 0}
+
+        pending_updates = []
+        found = 0
         for job in jobs:
+            found += 1
             try:
                 processed_result = self._process_single_job(job)
                 if processed_result:
-                    enriched_job = self._create_enriched_job(job, processed_result)
-                    self._save_processed_job(enriched_job)
+                    job_id, update_doc = self._create_enriched_job(job, processed_result)
+                    update = self._build_update(job_id, update_doc)
+                    if update:
+                        pending_updates.append(update)
+                    if len(pending_updates) >= WRITE_BATCH_SIZE:
+                        results["errors"] += self._flush_updates(pending_updates)
                     results["processed"] += 1
             except Exception as e:
                 logger.error(f"Error processing specific job: {e}")
                 results["errors"] += 1
 
+        results["errors"] += self._flush_updates(pending_updates)
+        self._stats_cache.clear()
+
+        logger.info(f"Processed {found} specific jobs")
+        results["not_found"] = len(job_urls) - found
         return results
 
 
-def main():
-    """Main function with integrated Vietnamese keywords processing."""
-    print("🇻🇳 Enhanced LinkedIn Job Processor with Vietnamese Keywords")
+# Per-process LinkedInJobProcessor for process_all_jobs worker pools, built by the initializer
+_worker_processor: Optional[LinkedInJobProcessor] = None
+
+
+def _init_job_worker(init_args: Dict[str, Any]):
+    global _worker_processor
+    _worker_processor = LinkedInJobProcessor(**init_args, worker=True)
+    # The pool already uses the CPUs; don't start a nested pool per batch
+    _worker_processor.nlp_processor.max_workers = 1
+
+
+def _process_and_save_in_worker(jobs: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], int]:
+    return _worker_processor._process_and_save_batch(jobs)
+
+
+def _print_final_report(processor: LinkedInJobProcessor) -> None:
+    """Print statistics, the detailed analysis and the enhancement summary."""
+    print("\n📋 Generating comprehensive final report...")
+    stats = processor._get_comprehensive_statistics()
+    processor.show_detailed_analysis()
+
+    print(f"\n" + "="*70)
+    print("🎉 VIETNAMESE KEYWORDS ENHANCEMENT REPORT")
     print("="*70)
+    print(f"✅ Total LinkedIn jobs: {stats.get('total_jobs', 0)}")
+    print(f"✅ Jobs processed: {stats.get('processed', 0)}")
+    print(f"✅ Vietnamese keywords detected: {stats.get('vietnamese', 0)}")
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
+    if stats.get('seniority_counts'):
+        print(f"✅ Seniority levels found: {len(stats['seniority_counts'])}")
+
+    if stats.get('tech_categories'):
+        print(f"✅ Technology categories: {len(stats['tech_categories'])}")
+
+    print(f"\n🚀 Features implemented:")
+    print(f"   • Vietnamese keyword detection")
+    print(f"   • Seniority level extraction")
+    print(f"   • Extended technology matching")
+    print(f"   • Comprehensive statistical analysis")
+    print(f"   • Real-time job processing")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Command-line interface; without a command the interactive menu is shown."""
+    parser = argparse.ArgumentParser(
+        description="Enhanced LinkedIn job processor with Vietnamese keywords support."
     )
+    subparsers = parser.add_subparsers(dest="command")
+
+    process_parser = subparsers.add_parser("process", help="process jobs that haven't been processed yet")
+    process_parser.add_argument("--limit", type=int, help="process at most this many jobs")
+    reprocess_parser = subparsers.add_parser("reprocess", help="reprocess all jobs, including processed ones")
+    for command_parser in (process_parser, reprocess_parser):
+        command_parser.add_argument("--processes", type=int, default=1,
+                                    help="worker processes for NLP (-1: one per CPU)")
+    subparsers.add_parser("stats", help="show comprehensive statistics")
+    quick_test_parser = subparsers.add_parser("quick-test", help="process a few sample jobs")
+    quick_test_parser.add_argument("--sample-size", type=int, default=3)
+    subparsers.add_parser("vietnamese-report", help="show the Vietnamese enhancement report")
+    subparsers.add_parser("report", help="generate the final report")
+    return parser
+
+
+def _run_command(processor: LinkedInJobProcessor, args: argparse.Namespace) -> None:
+    """Run one command-line command without prompting."""
+    if args.command == "process":
+        results = processor.process_all_jobs(limit=args.limit, n_processes=args.processes)
+        if results["processed"] > 0:
+            processor._get_comprehensive_statistics()
+    elif args.command == "reprocess":
+        processor.process_all_jobs(skip_processed=False, n_processes=args.processes)
+        processor._get_comprehensive_statistics()
+    elif args.command == "stats":
+        processor._get_comprehensive_statistics()
+    elif args.command == "quick-test":
+        processor.quick_test(sample_size=args.sample_size)
+    elif args.command == "vietnamese-report":
+        generate_final_report()
+    elif args.command == "report":
+        _print_final_report(processor)
+
+
+def _interactive_menu(processor: LinkedInJobProcessor) -> None:
+    """Prompt for menu options until the user exits."""
+    while True:
+        print(f"\n" + "="*50)
+        print("🎯 ENHANCED LINKEDIN JOB PROCESSOR MENU")
+        print("="*50)
+        print("1. 🚀 Process ALL LinkedIn jobs with Vietnamese keywords")
+        print("2. 📊 Show comprehensive statistics")
+        print("3. 🔍 Show vietnamese report")
+        print("4. ⚡ Quick test (3 sample jobs)")
+        print("5. 📈 Process specific number of jobs")
+        print("6. 🔄 Force reprocess all jobs")
+        print("7. 📋 Generate final report")
+        print("0. ❌ Exit")
+
+        choice = input("\nSelect option (0-7): ").strip()
+
+        if choice == "1":
+            # Process all jobs
+            print("\n🚀 Processing ALL LinkedIn jobs...")
+            results = processor.process_all_jobs()
+
+            if results["processed"] > 0:
+                processor._get_comprehensive_statistics()
 
-    try:
-        # Initialize enhanced processor
-        processor = LinkedInJobProcessor()
+        elif choice == "2":
+            # Show statistics
+            processor._get_comprehensive_statistics()
+
+        elif choice == "3":
+            # Detailed analysis
+            generate_final_report()
 
-        # Interactive menu
-        while True:
-            print(f"\n" + "="*50)
-            print("🎯 ENHANCED LINKEDIN JOB PROCESSOR MENU")
-            print("="*50)
-            print("1. 🚀 Process ALL LinkedIn jobs with Vietnamese keywords")
-            print("2. 📊 Show comprehensive statistics")
-            print("3. 🔍 Show vietnamese report")
-            print("4. ⚡ Quick test (3 sample jobs)")
-            print("5. 📈 Process specific number of jobs")
-            print("6. 🔄 Force reprocess all jobs")
-            print("7. 📋 Generate final report")
-            print("0. ❌ Exit")
-
-            choice = input("\nSelect option (0-7): ").strip()
-
-            if choice == "1":
-                # Process all jobs
-                print("\n🚀 Processing ALL LinkedIn jobs...")
-                results = processor.process_all_jobs()
+        elif choice == "4":
+            # Quick test
+            processor.quick_test(sample_size=3)
 
+        elif choice == "5":
+            # Process specific number
+            try:
+                limit = int(input("Enter number of jobs to process: "))
+                results = processor.process_all_jobs(limit=limit)
                 if results["processed"] > 0:
                     processor._get_comprehensive_statistics()
-
-            elif choice == "2":
-                # Show statistics
+            except ValueError:
+                print("❌ Invalid number")
+
+        elif choice == "6":
+            # Force reprocess
+            print("\n🔄 Force reprocessing ALL jobs...")
+            confirm = input("This will reprocess ALL jobs. Continue? (y/N): ")
+            if confirm.lower() == 'y':
+                results = processor.process_all_jobs(skip_processed=False)
                 processor._get_comprehensive_statistics()
+            else:
+                print("Cancelled.")
 
-            elif choice == "3":
-                # Detailed analysis
-                generate_final_report()
-
-            elif choice == "4":
-                # Quick test
-                processor.quick_test(sample_size=3)
-
-            elif choice == "5":
-                # Process specific number
-                try:
-                    limit = int(input("Enter number of jobs to process: "))
-                    results = processor.process_all_jobs(limit=limit)
-                    if results["processed"] > 0:
-                        processor._get_comprehensive_statistics()
-                except ValueError:
-                    print("❌ Invalid number")
-
-            elif choice == "6":
-                # Force reprocess
-                print("\n🔄 Force reprocessing ALL jobs...")
-                confirm = input("This will reprocess ALL jobs. Continue? (y/N): ")
-                if confirm.lower() == 'y':
-                    results = processor.process_all_jobs(skip_processed=False)
-                    processor._get_comprehensive_statistics()
-                else:
-                    print("Cancelled.")
-
-            elif choice == "7":
-                # Generate final report
-                print("\n📋 Generating comprehensive final report...")
-                stats = processor._get_comprehensive_statistics()
-                processor.show_detailed_analysis()
-
-                print(f"\n" + "="*70)
-                print("🎉 VIETNAMESE KEYWORDS ENHANCEMENT REPORT")
-                print("="*70)
-                print(f"✅ Total LinkedIn jobs: {stats.get('total_jobs', 0)}")
-                print(f"✅ Jobs processed: {stats.get('processed', 0)}")
-                print(f"✅ Vietnamese keywords detected: {stats.get('vietnamese', 0)}")
-
-                if stats.get('seniority_counts'):
-                    print(f"✅ Seniority levels found: {len(stats['seniority_counts'])}")
-
-                if stats.get('tech_categories'):
-                    print(f"✅ Technology categories: {len(stats['tech_categories'])}")
-
-                print(f"\n🚀 Features implemented:")
-                print(f"   • Vietnamese keyword detection")
-                print(f"   • Seniority level extraction")
-                print(f"   • Extended technology matching")
-                print(f"   • Comprehensive statistical analysis")
-                print(f"   • Real-time job processing")
-
-            elif choice == "0":
-                print("\n👋 Goodbye!")
-                break
+        elif choice == "7":
+            # Generate final report
+            _print_final_report(processor)
 
-            else:
-                print("❌ Invalid choice. Please select 0-7.")
+        elif choice == "0":
+            print("\n👋 Goodbye!")
+            break
+
+        else:
+            print("❌ Invalid choice. Please select 0-7.")
+
+        if choice != "0":
+            input("\nPress Enter to continue...")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function with integrated Vietnamese keywords processing.
+
+    With a command (see ``--help``) that command runs and the script exits, so it can be
+    scheduled; without one the interactive menu is shown.
+    """
+    args = _build_parser().parse_args(argv)
+
+    print("🇻🇳 Enhanced LinkedIn Job Processor with Vietnamese Keywords")
+    print("="*70)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    try:
+        # Initialize enhanced processor
+        processor = LinkedInJobProcessor()
 
-            if choice != "0":
-                input("\nPress Enter to continue...")
+        if args.command:
+            _run_command(processor, args)
+        else:
+            _interactive_menu(processor)
 
     except KeyboardInterrupt:
         print("\n\n👋 Process interrupted by user.")
@@ -740,6 +981,9 @@ def main():
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
+        if args.command:
+            # Let schedulers see the failure
+            sys.exit(1)
 
 
 if __name__ == "__main__":
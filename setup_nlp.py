@@ -81,7 +81,7 @@ def validate_installation():
 
         # Test fuzzy matching
         try:
-            from fuzzywuzzy import fuzz
+            from rapidfuzz import fuzz
             score = fuzz.ratio("test", "test")
             print("✓ Fuzzy matching available")
         except Exception as e:
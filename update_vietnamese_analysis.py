@@ -2,6 +2,7 @@
 """Update LinkedIn jobs in MongoDB with Vietnamese keywords and seniority detection."""
 
 import sys
+from heapq import nlargest
 from pathlib import Path
 
 # Add project root to path
@@ -44,9 +45,9 @@ def update_linkedin_jobs_with_vietnamese():
                 continue
 
             # Process with NLP pipeline
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = processor.process(description)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             # Prepare update data with Vietnamese fields
             update_data = {
@@ -166,7 +167,7 @@ def analyze_vietnamese_statistics():
     for category, keywords in sorted(vn_categories.items()):
         print(f"  {category}:")
         # Show top 3 keywords in each category
-        sorted_keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:3]
+        sorted_keywords = nlargest(3, keywords.items(), key=lambda x: x[1])
         for keyword, count in sorted_keywords:
             print(f"    {keyword}: {count} jobs")
 
@@ -2,6 +2,7 @@
 """Vietnamese Keywords Enhancement - Final Report."""
 
 import sys
+from heapq import nlargest
 from pathlib import Path
 
 # Add project root to path
@@ -75,8 +76,7 @@ def generate_final_report():
 
         # Show top keywords in each category
         if category in all_vn_keywords:
-            top_keywords = sorted(all_vn_keywords[category].items(),
-                                key=lambda x: x[1], reverse=True)[:3]
+            top_keywords = nlargest(3, all_vn_keywords[category].items(), key=lambda x: x[1])
             for keyword, kw_count in top_keywords:
                 print(f"  └─ {keyword:<25} │ {kw_count:>3} jobs")
 
@@ -94,7 +94,7 @@ def generate_final_report():
     print(f"\n💻 EXTENDED TECHNOLOGY CATEGORIES")
     print("-" * 50)
     print(f"Jobs with extended tech info: {len(tech_jobs)}")
-    for category, count in sorted(tech_categories.items(), key=lambda x: x[1], reverse=True)[:8]:
+    for category, count in nlargest(8, tech_categories.items(), key=lambda x: x[1]):
         print(f"{category:<30} │ {count:>3} mentions")
 
     # Sample job analysis